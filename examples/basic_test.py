@@ -13,7 +13,7 @@ Adapt the HOST, PORT, and login steps to match your MUD.
 from mudprod import (
     MUDClient,
     LoginConfig,
-    PromptConfig,
+    make_prompt_config,
     assert_contains,
     assert_prompt,
 )
@@ -24,8 +24,8 @@ PORT = 4000
 
 
 def main():
-    # Optional: customize prompt detection
-    prompt_config = PromptConfig(
+    # Optional: customize prompt detection (patterns are compiled once)
+    prompt_config = make_prompt_config(
         patterns=[r">\s*$", r":\s*$"],
         end_chars=">:",
     )
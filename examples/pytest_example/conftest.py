@@ -6,24 +6,31 @@ Customize the HOST, PORT, and login configuration for your MUD.
 """
 
 import pytest
-from mudprod import MUDClient, LoginConfig
+from mudprod import MUDClient, LoginConfig, make_prompt_config
 
 # Configure for your MUD
 HOST = "localhost"
 PORT = 4000
 USERNAME = "testuser"
 PASSWORD = "testpass"
+CONNECT_CHECK_TIMEOUT = 1.0  # seconds to wait for the server to accept
+
+# Shared across fixtures; the prompt regexes are compiled once per session
+PROMPT_CONFIG = make_prompt_config(patterns=[r">\s*$", r":\s*$", r"\]\s*$"])
 
 
 @pytest.fixture(scope="session")
 def server_available():
     """Check if server is available before running tests."""
     import socket
+
+    # A short timeout, so a down or firewalled server skips quickly
+    # instead of blocking for seconds
     try:
-        sock = socket.create_connection((HOST, PORT), timeout=5)
+        sock = socket.create_connection((HOST, PORT), timeout=CONNECT_CHECK_TIMEOUT)
         sock.close()
         return True
-    except (socket.error, socket.timeout):
+    except OSError:
         pytest.skip(f"MUD server at {HOST}:{PORT} is not available")
         return False
 
@@ -31,7 +38,7 @@ def server_available():
 @pytest.fixture
 def client(server_available):
     """Provide a connected and logged-in client."""
-    c = MUDClient(HOST, PORT)
+    c = MUDClient(HOST, PORT, prompt_config=PROMPT_CONFIG)
 
     if not c.connect():
         pytest.fail("Could not connect to server")
@@ -61,7 +68,7 @@ def client(server_available):
 @pytest.fixture
 def raw_client(server_available):
     """Provide a connected but NOT logged-in client."""
-    c = MUDClient(HOST, PORT)
+    c = MUDClient(HOST, PORT, prompt_config=PROMPT_CONFIG)
 
     if not c.connect():
         pytest.fail("Could not connect to server")
@@ -6,11 +6,26 @@ Connect to MUD servers via telnet, send commands, and validate responses.
 
 __version__ = "0.1.0"
 
-from .client import MUDClient, PromptConfig, LoginConfig, quick_connect
+from .client import (
+    MUDClient,
+    PromptConfig,
+    LoginConfig,
+    make_prompt_config,
+    quick_connect,
+)
+from .aclient import AsyncMUDClient, run_async
+from .host import MUDHost
 from .response import MUDResponse
 from .session import SessionManager, SessionConfig
 from .server import SessionServer, SessionClient, start_server_background
-from .ansi import clean_output, strip_ansi, strip_telnet_codes
+from .ansi import (
+    clean_output,
+    clean_output_bytes,
+    clean_output_text,
+    strip_ansi,
+    strip_telnet_codes,
+    strip_telnet_bytes,
+)
 from .assertions import (
     assert_contains,
     assert_not_contains,
@@ -22,9 +37,13 @@ from .assertions import (
 
 __all__ = [
     "MUDClient",
+    "AsyncMUDClient",
+    "MUDHost",
+    "run_async",
     "MUDResponse",
     "PromptConfig",
     "LoginConfig",
+    "make_prompt_config",
     "SessionManager",
     "SessionConfig",
     "SessionServer",
@@ -32,8 +51,11 @@ __all__ = [
     "start_server_background",
     "quick_connect",
     "clean_output",
+    "clean_output_bytes",
+    "clean_output_text",
     "strip_ansi",
     "strip_telnet_codes",
+    "strip_telnet_bytes",
     "assert_contains",
     "assert_not_contains",
     "assert_matches",
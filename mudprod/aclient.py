@@ -0,0 +1,474 @@
+"""
+AsyncMUDClient - asyncio telnet client for MUD server testing.
+
+Same API as MUDClient, but every I/O method is a coroutine built on
+asyncio streams. A single event loop can drive many connections at once
+instead of needing one blocking client (and thread) per MUD.
+"""
+
+import asyncio
+import codecs
+import logging
+from typing import Any, Awaitable, Optional, Pattern, Tuple
+
+from .ansi import IncrementalTelnetStripper, clean_output
+from .client import (
+    ConnectionState,
+    LoginConfig,
+    PromptConfig,
+    MUDClient,
+    _PatternMatcher,
+    _compile_wait_pattern,
+    _detect_prompt,
+)
+from .response import MUDResponse
+
+
+class AsyncMUDClient:
+    """
+    Asyncio client for MUD server interaction.
+
+    Basic usage:
+        client = AsyncMUDClient("localhost", 4000)
+        await client.connect()
+        await client.login(LoginConfig(steps=[
+            ("name:", "myusername"),
+            ("password:", "mypassword"),
+        ]))
+
+        response = await client.send_command("look")
+        print(response.clean)
+
+        await client.disconnect()
+
+    As async context manager:
+        async with AsyncMUDClient("localhost", 4000) as client:
+            await client.login(login_config)
+            response = await client.send_command("look")
+        # Automatically disconnects
+    """
+
+    DEFAULT_TIMEOUT = MUDClient.DEFAULT_TIMEOUT
+    DEFAULT_COMMAND_TIMEOUT = MUDClient.DEFAULT_COMMAND_TIMEOUT
+    FAST_COMMAND_TIMEOUT = MUDClient.FAST_COMMAND_TIMEOUT
+    SELECT_POLL_INTERVAL = MUDClient.SELECT_POLL_INTERVAL
+    READ_DELAY = MUDClient.READ_DELAY
+    GREETING_TIMEOUT = MUDClient.GREETING_TIMEOUT
+    READ_CHUNK_SIZE = MUDClient.READ_CHUNK_SIZE
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        timeout: float = DEFAULT_TIMEOUT,
+        prompt_config: Optional[PromptConfig] = None,
+        logger: Optional[logging.Logger] = None,
+        auto_reconnect: bool = False,
+    ):
+        """
+        Initialize async MUD client.
+
+        Args:
+            host: Server hostname or IP
+            port: Server port
+            timeout: Connection timeout in seconds
+            prompt_config: Custom prompt detection configuration
+            logger: Optional logger instance
+            auto_reconnect: Automatically reconnect if connection drops
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.prompt_config = prompt_config or PromptConfig()
+        self.logger = logger or logging.getLogger(__name__)
+        self.auto_reconnect = auto_reconnect
+
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._state = ConnectionState.DISCONNECTED
+        self._login_config: Optional[LoginConfig] = None
+        # Carry an IAC sequence or UTF-8 character split across reads over
+        # to the next one
+        self._telnet = IncrementalTelnetStripper()
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    async def __aenter__(self) -> "AsyncMUDClient":
+        """Async context manager entry - connects automatically."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - disconnects automatically."""
+        await self.disconnect()
+        return None
+
+    @property
+    def state(self) -> ConnectionState:
+        """Current connection state."""
+        return self._state
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether client is connected to server."""
+        return self._writer is not None and self._state != ConnectionState.DISCONNECTED
+
+    @property
+    def is_in_game(self) -> bool:
+        """Whether client is logged in and in-game."""
+        return self._state == ConnectionState.IN_GAME
+
+    async def connect(self) -> bool:
+        """
+        Establish TCP connection to the MUD server.
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        # Close any previous connection rather than leak its transport
+        self._mark_disconnected()
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                timeout=self.timeout,
+            )
+            self._state = ConnectionState.CONNECTED
+            self._telnet.reset()
+            self._decoder.reset()
+
+            # Read initial greeting/banner
+            greeting = await self._read_until_quiet(timeout=self.GREETING_TIMEOUT)
+            self.logger.debug("Greeting: %s...", greeting[:200] or "(empty)")
+
+            self.logger.info("Connected to %s:%s", self.host, self.port)
+            return True
+
+        except Exception as e:
+            self.logger.error("Connection failed: %s", e)
+            self._mark_disconnected()
+            return False
+
+    async def disconnect(self) -> None:
+        """Clean disconnect from server."""
+        if self._writer:
+            try:
+                self._writer.close()
+                await self._writer.wait_closed()
+            except Exception:
+                pass
+        self._reader = None
+        self._writer = None
+        self._state = ConnectionState.DISCONNECTED
+        self.logger.info("Disconnected")
+
+    async def reconnect(self) -> bool:
+        """
+        Reconnect to the server and re-login if credentials are stored.
+
+        Returns:
+            True if reconnection (and re-login if applicable) successful
+        """
+        self.logger.info("Attempting reconnect...")
+        await self.disconnect()
+
+        if not await self.connect():
+            return False
+
+        if self._login_config:
+            return await self.login(self._login_config)
+
+        return True
+
+    async def ensure_connected(self) -> bool:
+        """
+        Ensure the client is connected, reconnecting if necessary.
+
+        Returns:
+            True if connected (or successfully reconnected)
+        """
+        if self.is_connected:
+            return True
+
+        if self.auto_reconnect:
+            return await self.reconnect()
+
+        return False
+
+    async def login(self, config: LoginConfig) -> bool:
+        """
+        Execute login flow based on configuration.
+
+        Args:
+            config: LoginConfig with steps and success/failure patterns
+
+        Returns:
+            True if login successful, False otherwise
+        """
+        self._state = ConnectionState.AUTHENTICATING
+        self._login_config = config  # Store for auto-reconnect
+
+        try:
+            matcher = _PatternMatcher()
+            for (prompt_pattern, response_text), (step_re, width) in zip(
+                config.steps, config.compiled_steps
+            ):
+                # Wait for the expected prompt, continuing after the last one
+                found, _ = await self._wait_for(matcher, step_re, width, self.timeout)
+
+                if not found:
+                    self.logger.warning("Did not see expected prompt: %s", prompt_pattern)
+                    # Continue anyway - some MUDs don't wait for input
+
+                # Send the response
+                await self.send_raw(f"{response_text}\n")
+
+            # Read final response - wait for output to settle or timeout
+            final_output = await self._read_until_quiet(timeout=self.READ_DELAY * 3)
+            clean = clean_output(final_output)
+
+            # Check for failure patterns
+            for pattern in config.compiled_failure_patterns:
+                if pattern.search(clean):
+                    self.logger.error("Login failed - matched: %s", pattern.pattern)
+                    return False
+
+            # Check for success patterns
+            for pattern in config.compiled_success_patterns:
+                if pattern.search(clean):
+                    self._state = ConnectionState.IN_GAME
+                    self.logger.info("Login successful")
+                    return True
+
+            # No explicit success pattern, but also no failure
+            self._state = ConnectionState.IN_GAME
+            self.logger.info("Login completed (no explicit success pattern)")
+            return True
+
+        except Exception as e:
+            self.logger.error("Login failed: %s", e)
+            return False
+
+    async def send_command(
+        self,
+        command: str,
+        wait_time: float = None,
+        fast: bool = False,
+    ) -> MUDResponse:
+        """
+        Send a command and receive response.
+
+        Args:
+            command: The command to send (e.g., "look", "say hello")
+            wait_time: Time to wait for response (default: DEFAULT_COMMAND_TIMEOUT)
+            fast: Use shorter timeout for quick commands (look, score, inv, etc.)
+
+        Returns:
+            MUDResponse with raw and cleaned output
+        """
+        if not await self.ensure_connected():
+            self.logger.error("Not connected and could not reconnect")
+            return MUDResponse(raw="", prompt_detected=False)
+
+        if wait_time is None:
+            wait_time = self.FAST_COMMAND_TIMEOUT if fast else self.DEFAULT_COMMAND_TIMEOUT
+
+        await self.send_raw(f"{command}\n")
+        return await self._read_until_prompt(wait_time)
+
+    async def send_raw(self, data: str) -> None:
+        """
+        Send raw data to server without waiting for response.
+
+        Args:
+            data: Raw string to send (include \\n for newlines)
+        """
+        if self._writer:
+            self._writer.write(data.encode('utf-8'))
+            await self._writer.drain()
+            self.logger.debug("Sent: %r", data)
+
+    async def read_available(self) -> MUDResponse:
+        """Read the data that arrives within a short poll interval."""
+        raw = await self._read_until_quiet(timeout=self.SELECT_POLL_INTERVAL)
+        return MUDResponse(raw=raw)
+
+    async def wait_for_pattern(
+        self,
+        pattern: str,
+        timeout: float = 10.0,
+        regex: bool = False
+    ) -> Tuple[bool, str]:
+        """
+        Wait for a specific pattern in output.
+
+        Args:
+            pattern: String or regex pattern to wait for
+            timeout: Max time to wait in seconds
+            regex: Treat pattern as regex
+
+        Returns:
+            Tuple of (found: bool, accumulated_output: str)
+        """
+        compiled, width = _compile_wait_pattern(pattern, regex)
+        return await self._wait_for(_PatternMatcher(), compiled, width, timeout)
+
+    async def _wait_for(
+        self,
+        matcher: _PatternMatcher,
+        pattern: Pattern,
+        width: Optional[int],
+        timeout: float,
+    ) -> Tuple[bool, str]:
+        """Feed server output to matcher until pattern is found or timeout."""
+        accumulated = ""
+        # Output left over from an earlier wait may already contain it
+        if matcher.search(pattern, width):
+            return True, accumulated
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            chunk = await self._read_chunk(remaining)
+            if chunk is None:
+                break
+            if not chunk:
+                continue
+
+            accumulated += chunk
+            matcher.feed_text(chunk)
+            if matcher.search(pattern, width):
+                return True, accumulated
+
+        return False, accumulated
+
+    async def _read_until_prompt(self, wait_time: float) -> MUDResponse:
+        """Collect output until a prompt is detected or wait_time elapses."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_time
+        response = ""
+        detected = False
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            chunk = await self._read_chunk(remaining)
+            if chunk is None:
+                break
+            if chunk:
+                response += chunk
+                # If we see a prompt, we're done immediately
+                if _detect_prompt(self.prompt_config, response):
+                    detected = True
+                    break
+
+        return MUDResponse(raw=response, prompt_detected=detected)
+
+    async def _read_until_quiet(self, timeout: float = 0.5) -> str:
+        """
+        Read until timeout, or until data has arrived and then stopped.
+
+        Returns as soon as the server goes quiet for SELECT_POLL_INTERVAL
+        after sending something.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        result = ""
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            wait = min(self.SELECT_POLL_INTERVAL, remaining) if result else remaining
+            chunk = await self._read_chunk(wait)
+            if chunk is None:
+                break
+            if chunk:
+                result += chunk
+            elif result:
+                # We have data and nothing more is coming
+                break
+
+        return result
+
+    async def _read_chunk(self, timeout: float) -> Optional[str]:
+        """
+        Read one chunk from the server.
+
+        Returns:
+            Decoded chunk, "" if nothing arrived within timeout,
+            or None if the connection is gone
+        """
+        if self._reader is None:
+            return None
+
+        try:
+            data = await asyncio.wait_for(
+                self._reader.read(self.READ_CHUNK_SIZE), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            return ""
+        except ConnectionResetError:
+            self.logger.info("Connection reset by server")
+            self._mark_disconnected()
+            return None
+
+        if not data:
+            # EOF means server closed the connection
+            self.logger.info("Server closed connection")
+            self._mark_disconnected()
+            return None
+
+        result = self._decoder.decode(self._telnet.feed(data))
+        self.logger.debug("Read %d bytes", len(result))
+        return result
+
+    def _mark_disconnected(self) -> None:
+        """Close and drop the streams, e.g. after the server went away."""
+        if self._writer:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+        self._state = ConnectionState.DISCONNECTED
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create the fastest available event loop.
+
+    Uses uvloop (pip install "mudprod[uvloop]") when it is installed -
+    its libuv-based transports cut per-read overhead when one loop drives
+    hundreds of connections - and the standard asyncio loop otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def run_async(main: Awaitable) -> Any:
+    """
+    asyncio.run() on the loop from new_event_loop().
+
+    Args:
+        main: Coroutine to run to completion
+
+    Returns:
+        The coroutine's result
+    """
+    loop = new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
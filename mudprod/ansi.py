@@ -6,12 +6,14 @@ This module strips them for clean text comparison in tests.
 """
 
 import re
+from typing import Tuple
 
-# Standard ANSI escape sequence pattern (colors, formatting)
-ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-9;]*m')
+# ANSI CSI sequences: colors/formatting (SGR, ending in 'm') as well as
+# cursor movement and other extended codes
+ANSI_PATTERN = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
 
-# Extended ANSI (cursor movement, etc.)
-ANSI_EXTENDED_PATTERN = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+# Above this length strip_ansi() uses the numba kernel, if numba is installed
+ANSI_NUMBA_THRESHOLD = 4096
 
 # Telnet IAC sequences (0xFF followed by command bytes)
 TELNET_PATTERN = re.compile(r'[\xff][\xfb-\xfe].|\xff\xff')
@@ -22,21 +24,126 @@ BELL_PATTERN = re.compile(r'\x07')
 # Carriage return (often paired with newlines)
 CR_PATTERN = re.compile(r'\r')
 
+# Line endings (CRLF or bare CR) and runs of blank lines
+LINE_ENDING_PATTERN = re.compile(r'\r\n?')
+BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+
+# Everything clean_output() removes, fused into one pattern so a response
+# is scanned and copied once instead of once per kind of sequence
+CLEAN_PATTERN = re.compile(r'\x1b\[[0-9;]*[A-Za-z]|\xff[\xfb-\xfe].|\xff\xff|[\x07\r]')
+
+# An escape sequence that is not finished yet (cut off mid-chunk)
+_PARTIAL_CSI_PATTERN = re.compile(r'\x1b(?:\[[0-9;]*)?')
+
+# Characters that introduce something clean_output() would remove
+_CLEAN_INTRODUCERS = ('\x1b', '\xff', '\x07', '\r')
+
+# Bytes counterparts of the above, for cleaning before UTF-8 decoding
+ANSI_RE = re.compile(rb'\x1b\[[0-9;]*[A-Za-z]')
+CLEAN_BYTES_PATTERN = re.compile(ANSI_RE.pattern + rb'|\xff[\xfb-\xfe].|\xff\xff|[\x07\r]')
+_CLEAN_BYTES_INTRODUCERS = (b'\x1b', b'\xff', b'\x07', b'\r')
+
 
 def strip_ansi(text: str) -> str:
     """Remove all ANSI escape sequences from text."""
-    text = ANSI_ESCAPE_PATTERN.sub('', text)
-    text = ANSI_EXTENDED_PATTERN.sub('', text)
-    return text
+    if '\x1b' not in text:
+        return text
+    if len(text) > ANSI_NUMBA_THRESHOLD:
+        numba_strip = _load_numba_strip()
+        if numba_strip is not None:
+            return numba_strip(text)
+    return ANSI_PATTERN.sub('', text)
+
+
+_numba_strip = None
+_numba_checked = False
+
+
+def _load_numba_strip():
+    """Import the optional numba stripper once; None if unavailable."""
+    global _numba_strip, _numba_checked
+    if not _numba_checked:
+        _numba_checked = True
+        try:
+            from .ansi_numba import strip_ansi as _numba_strip
+        except ImportError:
+            _numba_strip = None
+    return _numba_strip
 
 
 def strip_telnet_codes(text: str) -> str:
     """Remove telnet IAC/negotiation sequences."""
+    if '\xff' not in text:
+        return text
     return TELNET_PATTERN.sub('', text)
 
 
+def strip_telnet_bytes(data: bytes) -> bytes:
+    """
+    Remove telnet IAC sequences from raw socket bytes.
+
+    Linear scan for IAC (0xFF): the run before it is kept, then the
+    2-byte (IAC cmd) or 3-byte (IAC WILL/WONT/DO/DONT opt) sequence is
+    skipped. Works before UTF-8 decoding, where 0xFF is still intact,
+    and drops a trailing partial sequence at the end of a buffer (see
+    IncrementalTelnetStripper to keep it for the next read instead).
+    """
+    return _strip_telnet(data)[0]
+
+
+def _strip_telnet(data: bytes) -> Tuple[bytes, bytes]:
+    """
+    strip_telnet_bytes(), also returning the unfinished sequence.
+
+    Returns:
+        Tuple of (data with complete IAC sequences removed, partial IAC
+        sequence cut off at the end of data or b"")
+    """
+    if b'\xff' not in data:
+        return data, b''
+
+    parts = []
+    i = 0
+    length = len(data)
+    while True:
+        j = data.find(b'\xff', i)
+        if j < 0:
+            parts.append(data[i:])
+            return b''.join(parts), b''
+        parts.append(data[i:j])
+        end = j + 3 if j + 1 < length and 0xfb <= data[j + 1] <= 0xfe else j + 2
+        if end > length:
+            return b''.join(parts), data[j:]
+        i = end
+
+
+class IncrementalTelnetStripper:
+    """
+    strip_telnet_bytes() for bytes that arrive in chunks.
+
+    An IAC sequence cut off at the end of a chunk is held back until the
+    next feed() completes it, so its option byte can't end up in the text.
+    """
+
+    def __init__(self):
+        self._pending = b''
+
+    def feed(self, data: bytes) -> bytes:
+        """Strip the next chunk; returns everything up to any cut-off sequence."""
+        if self._pending:
+            data = self._pending + data
+        result, self._pending = _strip_telnet(data)
+        return result
+
+    def reset(self) -> None:
+        """Forget a held-back sequence (e.g. when the connection changes)."""
+        self._pending = b''
+
+
 def strip_bell(text: str) -> str:
     """Remove bell characters."""
+    if '\x07' not in text:
+        return text
     return BELL_PATTERN.sub('', text)
 
 
@@ -46,17 +153,78 @@ def clean_output(text: str) -> str:
 
     Removes ANSI codes, telnet sequences, bells, and normalizes line endings.
     """
-    text = strip_telnet_codes(text)
-    text = strip_ansi(text)
-    text = strip_bell(text)
-    text = CR_PATTERN.sub('', text)
-    return text
+    # Fast path: most MUD output has nothing to strip
+    if not any(c in text for c in _CLEAN_INTRODUCERS):
+        return text
+    return CLEAN_PATTERN.sub('', text)
+
+
+class IncrementalCleaner:
+    """
+    clean_output() for text that arrives in chunks.
+
+    Each feed() returns the cleaned form of just the new text, so a
+    growing buffer never has to be re-cleaned from the start. An escape
+    sequence cut off at the end of a chunk is held back until the next
+    feed() completes it.
+    """
+
+    # Longest unterminated "ESC [ params" tail worth holding back
+    MAX_PENDING = 32
+
+    def __init__(self):
+        self._pending = ''
+
+    def feed(self, text: str) -> str:
+        """Clean the next chunk of text; returns only the newly cleaned part."""
+        if self._pending:
+            text = self._pending + text
+            self._pending = ''
+
+        i = text.rfind('\x1b')
+        if i >= 0 and len(text) - i <= self.MAX_PENDING:
+            if _PARTIAL_CSI_PATTERN.fullmatch(text, i):
+                self._pending = text[i:]
+                text = text[:i]
+
+        return clean_output(text)
+
+    def flush(self) -> str:
+        """Return any held-back text as-is (e.g. when the stream ends)."""
+        text, self._pending = self._pending, ''
+        return text
+
+
+def clean_output_bytes(data: bytes) -> bytes:
+    """
+    clean_output() for raw socket bytes.
+
+    ANSI, telnet and bell sequences are plain ASCII/IAC bytes, so they can
+    be stripped before decoding - the scan runs over the compact bytes
+    rather than a (possibly wide) decoded str.
+    """
+    if not any(c in data for c in _CLEAN_BYTES_INTRODUCERS):
+        return data
+    return CLEAN_BYTES_PATTERN.sub(b'', data)
+
+
+def clean_output_text(data: bytes) -> str:
+    """
+    Clean raw socket bytes and decode them to text in one step.
+
+    For callers holding undecoded output: equivalent to
+    clean_output(data.decode('utf-8', errors='replace')), but the
+    cleaning runs on the bytes and only the cleaned result is decoded.
+    """
+    return clean_output_bytes(data).decode('utf-8', errors='replace')
 
 
 def normalize_whitespace(text: str) -> str:
     """Normalize line endings and collapse multiple blank lines."""
+    if '\r' not in text and '\n\n\n' not in text:
+        return text.strip()
     # Normalize line endings
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = LINE_ENDING_PATTERN.sub('\n', text)
     # Collapse multiple blank lines to single
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = BLANK_LINES_PATTERN.sub('\n\n', text)
     return text.strip()
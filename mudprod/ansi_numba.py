@@ -0,0 +1,57 @@
+"""
+Numba-compiled ANSI stripper for large MUD output.
+
+Optional accelerator for mudprod.ansi - requires numba and numpy
+(pip install "mudprod[numba]"). strip_ansi() routes large inputs
+through here automatically when the import succeeds.
+"""
+
+import numpy as np
+from numba import njit
+
+_ESC = 0x1b
+_LBRACKET = 0x5b
+
+
+@njit(cache=True)
+def strip_ansi_bytes(buf: np.ndarray, out: np.ndarray) -> int:
+    """
+    Copy buf into out without ANSI CSI sequences.
+
+    Removes exactly what ansi.ANSI_PATTERN matches: ESC '[' followed by
+    digits/semicolons and a terminating letter. Incomplete sequences are
+    copied through unchanged.
+
+    Args:
+        buf: Input bytes as a uint8 array
+        out: Output uint8 array, at least len(buf) long
+
+    Returns:
+        Number of bytes written to out
+    """
+    n = buf.shape[0]
+    i = 0
+    o = 0
+    while i < n:
+        c = buf[i]
+        if c == _ESC and i + 1 < n and buf[i + 1] == _LBRACKET:
+            j = i + 2
+            while j < n and ((0x30 <= buf[j] <= 0x39) or buf[j] == 0x3b):
+                j += 1
+            if j < n and ((0x41 <= buf[j] <= 0x5a) or (0x61 <= buf[j] <= 0x7a)):
+                # Complete CSI sequence - drop it
+                i = j + 1
+                continue
+        out[o] = c
+        o += 1
+        i += 1
+    return o
+
+
+def strip_ansi(text: str) -> str:
+    """Strip ANSI sequences from text using the compiled kernel."""
+    data = text.encode('utf-8', errors='surrogatepass')
+    buf = np.frombuffer(data, dtype=np.uint8)
+    out = np.empty_like(buf)
+    n = strip_ansi_bytes(buf, out)
+    return out[:n].tobytes().decode('utf-8', errors='surrogatepass')
@@ -5,8 +5,10 @@ These assertions provide clear error messages with context
 when tests fail.
 """
 
+import functools
+import itertools
 import re
-from typing import Union, Optional
+from typing import List, Union, Optional
 
 from .response import MUDResponse
 
@@ -16,6 +18,12 @@ class MUDAssertionError(AssertionError):
     pass
 
 
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int = 0) -> "re.Pattern":
+    """Compile and cache a regex pattern used by the assertions."""
+    return re.compile(pattern, flags)
+
+
 def _get_text(response: Union[MUDResponse, str]) -> str:
     """Extract clean text from response or string."""
     if isinstance(response, MUDResponse):
@@ -23,6 +31,13 @@ def _get_text(response: Union[MUDResponse, str]) -> str:
     return response
 
 
+def _contains_text(text: str, pattern: str, case_sensitive: bool) -> bool:
+    """Plain substring check, optionally ignoring case."""
+    if case_sensitive:
+        return pattern in text
+    return pattern.lower() in text.lower()
+
+
 def assert_contains(
     response: Union[MUDResponse, str],
     pattern: str,
@@ -45,22 +60,15 @@ def assert_contains(
     """
     text = _get_text(response)
 
-    if not case_sensitive:
-        check_text = text.lower()
-        check_pattern = pattern if regex else pattern.lower()
-    else:
-        check_text = text
-        check_pattern = pattern
-
     if regex:
         flags = 0 if case_sensitive else re.IGNORECASE
-        if not re.search(check_pattern, text, flags):
+        if not _compile(pattern, flags).search(text):
             raise MUDAssertionError(
                 f"Pattern '{pattern}' not found in response. {msg}\n"
                 f"Response:\n{text[:500]}"
             )
     else:
-        if check_pattern not in check_text:
+        if not _contains_text(text, pattern, case_sensitive):
             raise MUDAssertionError(
                 f"'{pattern}' not found in response. {msg}\n"
                 f"Response:\n{text[:500]}"
@@ -89,22 +97,15 @@ def assert_not_contains(
     """
     text = _get_text(response)
 
-    if not case_sensitive:
-        check_text = text.lower()
-        check_pattern = pattern if regex else pattern.lower()
-    else:
-        check_text = text
-        check_pattern = pattern
-
     if regex:
         flags = 0 if case_sensitive else re.IGNORECASE
-        if re.search(check_pattern, text, flags):
+        if _compile(pattern, flags).search(text):
             raise MUDAssertionError(
                 f"Pattern '{pattern}' was found but should not be present. {msg}\n"
                 f"Response:\n{text[:500]}"
             )
     else:
-        if check_pattern in check_text:
+        if _contains_text(text, pattern, case_sensitive):
             raise MUDAssertionError(
                 f"'{pattern}' was found but should not be present. {msg}\n"
                 f"Response:\n{text[:500]}"
@@ -134,7 +135,7 @@ def assert_matches(
     """
     text = _get_text(response)
 
-    match = re.search(regex_pattern, text, flags)
+    match = _compile(regex_pattern, flags).search(text)
     if not match:
         raise MUDAssertionError(
             f"Response does not match pattern '{regex_pattern}'. {msg}\n"
@@ -180,20 +181,27 @@ def assert_line_count(
         MUDAssertionError: If line count out of range
     """
     if isinstance(response, MUDResponse):
-        lines = response.lines
+        count = len(response.lines)
     else:
-        lines = [line for line in response.split('\n') if line.strip()]
-
-    count = len(lines)
+        # Count without materializing a list of lines
+        count = sum(1 for line in response.split('\n') if line and not line.isspace())
 
     if count < min_lines:
         raise MUDAssertionError(
             f"Expected at least {min_lines} lines, got {count}. {msg}\n"
-            f"Lines: {lines[:10]}"
+            f"Lines: {_first_lines(response)}"
         )
 
     if max_lines is not None and count > max_lines:
         raise MUDAssertionError(
             f"Expected at most {max_lines} lines, got {count}. {msg}\n"
-            f"Lines: {lines[:10]}"
+            f"Lines: {_first_lines(response)}"
         )
+
+
+def _first_lines(response: Union[MUDResponse, str], limit: int = 10) -> List[str]:
+    """First few non-empty lines, for failure messages."""
+    if isinstance(response, MUDResponse):
+        return response.lines[:limit]
+    lines = (line for line in response.split('\n') if line and not line.isspace())
+    return list(itertools.islice(lines, limit))
@@ -5,19 +5,25 @@ Connects to MUD servers, handles login flows, sends commands,
 and captures responses for validation.
 """
 
+import codecs
 import socket
-import select
+import selectors
 import time
 import logging
 import re
-from typing import Optional, List, Tuple, Callable, Union
+from functools import cached_property, lru_cache
+from typing import Optional, List, Tuple, Callable, Union, Sequence, Pattern
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
-from .ansi import clean_output
+from .ansi import IncrementalCleaner, IncrementalTelnetStripper, clean_output
 from .response import MUDResponse
 
 
+# Backreferences change meaning once patterns are fused into one regex
+_BACKREF_PATTERN = re.compile(r'\\[1-9]|\(\?P=')
+
+
 class ConnectionState(Enum):
     """Tracks the client's connection state."""
     DISCONNECTED = auto()
@@ -26,15 +32,20 @@ class ConnectionState(Enum):
     IN_GAME = auto()
 
 
-@dataclass
+@dataclass(frozen=True)
 class PromptConfig:
     """
     Configuration for prompt detection.
 
+    Frozen, so one instance can safely be shared by many clients (its
+    compiled patterns are cached on first use).
+
     Attributes:
         patterns: List of regex patterns that indicate a prompt
         end_chars: Simple characters that indicate end of prompt (e.g., '>', ':')
         custom_detector: Optional callable for custom prompt detection
+        tail_chars: Only this many trailing characters of output are
+            checked against end_chars and patterns
     """
     patterns: List[str] = field(default_factory=lambda: [
         r'>\s*$',           # Standard ">" prompt
@@ -43,15 +54,78 @@ class PromptConfig:
     ])
     end_chars: str = ">]:"
     custom_detector: Optional[Callable[[str], bool]] = None
+    tail_chars: int = 256
+
+    @cached_property
+    def compiled_patterns(self) -> List[Pattern]:
+        """Compiled form of patterns, built on first use and then reused."""
+        return [re.compile(p) for p in self.patterns]
+
+    @cached_property
+    def combined_pattern(self) -> Optional[Pattern]:
+        """
+        All patterns fused into one alternation, so a check is one scan.
+
+        None if there are no patterns or they can't be combined (flags,
+        inline or passed to a pre-compiled pattern, or backreferences);
+        callers then try compiled_patterns one by one.
+        """
+        compiled = self.compiled_patterns
+        if not compiled:
+            return None
+        for p in compiled:
+            # Fusing would drop the flags and renumber the groups
+            if p.flags & ~re.UNICODE or _BACKREF_PATTERN.search(p.pattern):
+                return None
+        try:
+            return re.compile("|".join(f"(?:{p.pattern})" for p in compiled))
+        except re.error:
+            return None
+
+
+def make_prompt_config(
+    patterns: Sequence[Union[str, Pattern]],
+    end_chars: str = ">]:",
+) -> PromptConfig:
+    """
+    Build a PromptConfig with its patterns compiled up front.
+
+    Calls with the same patterns and end_chars return the same shared
+    PromptConfig, so test suites that build their config per test only
+    compile the regexes once. Treat the returned config as read-only.
+
+    Args:
+        patterns: Regex strings (or pre-compiled patterns) indicating a prompt
+        end_chars: Simple characters that indicate end of prompt
+
+    Returns:
+        A PromptConfig with compiled_patterns already populated
+    """
+    return _make_prompt_config(tuple(patterns), end_chars)
 
 
-@dataclass
+@lru_cache(maxsize=64)
+def _make_prompt_config(patterns: Tuple, end_chars: str) -> PromptConfig:
+    config = PromptConfig(patterns=list(patterns), end_chars=end_chars)
+    # Compile eagerly
+    config.compiled_patterns
+    config.combined_pattern
+    return config
+
+
+@dataclass(frozen=True)
 class LoginConfig:
     """
     Configuration for the login flow.
 
     Different MUDs have different login sequences. Configure this
-    to match your MUD's login flow.
+    to match your MUD's login flow. Frozen, so one instance can safely
+    be shared by many sessions.
+
+    Step prompt patterns are matched case-insensitively. Patterns with no
+    regex metacharacters (e.g. "name:") are matched literally, as escaped
+    regexes, and a failed search skips text that can no longer start a
+    match.
 
     Attributes:
         steps: List of (prompt_pattern, response) tuples
@@ -70,6 +144,99 @@ class LoginConfig:
         r'[Ii]ncorrect',
     ])
 
+    @cached_property
+    def compiled_success_patterns(self) -> List[Pattern]:
+        """Compiled form of success_patterns, built on first use."""
+        return [re.compile(p) for p in self.success_patterns]
+
+    @cached_property
+    def compiled_failure_patterns(self) -> List[Pattern]:
+        """Compiled form of failure_patterns, built on first use."""
+        return [re.compile(p) for p in self.failure_patterns]
+
+    @cached_property
+    def compiled_steps(self) -> List[Tuple[Pattern, Optional[int]]]:
+        """Compiled step prompt patterns (with plain-text widths), built on first use."""
+        return [
+            _compile_wait_pattern(prompt, regex=not _is_plain(prompt))
+            for prompt, _ in self.steps
+        ]
+
+
+_REGEX_METACHARS = frozenset('.^$*+?{}[]|\\()')
+
+
+def _is_plain(pattern: str) -> bool:
+    """Whether pattern has no regex metacharacters and can be matched literally."""
+    return not any(c in _REGEX_METACHARS for c in pattern)
+
+
+@lru_cache(maxsize=128)
+def _compile_ignorecase(pattern: str) -> Pattern:
+    """Compile (and cache) a case-insensitive wait_for_pattern() regex."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _compile_wait_pattern(pattern: str, regex: bool) -> Tuple[Pattern, Optional[int]]:
+    """
+    Compile a wait_for_pattern()/login step pattern for _PatternMatcher.
+
+    Returns:
+        Tuple of (case-insensitive regex, match width for plain text
+        patterns or None for regexes)
+    """
+    if regex:
+        return _compile_ignorecase(pattern), None
+    return _compile_ignorecase(re.escape(pattern)), len(pattern)
+
+
+class _PatternMatcher:
+    """
+    Incremental matcher behind wait_for_pattern() and login().
+
+    Raw chunks are decoded and cleaned as they arrive and appended to a
+    running clean buffer, so earlier output is never re-cleaned. Each
+    search resumes where the previous match ended, so a sequence of
+    patterns (login steps) scans the output once rather than once per
+    pattern, and plain-text patterns skip text already ruled out.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._cleaner = IncrementalCleaner()
+        self._clean = ""
+        self._pos = 0
+
+    def feed(self, data: bytes) -> None:
+        """Add raw bytes from the socket."""
+        self.feed_text(self._decoder.decode(data))
+
+    def feed_text(self, text: str) -> None:
+        """Add already-decoded text."""
+        new = self._cleaner.feed(text)
+        if new:
+            self._clean += new
+
+    def search(self, pattern: Pattern, width: Optional[int] = None) -> bool:
+        """
+        Search the output after the previous match.
+
+        Args:
+            pattern: Compiled pattern from _compile_wait_pattern()
+            width: Match width of a plain text pattern, None for regexes
+
+        Returns:
+            True if found; later searches start after this match
+        """
+        match = pattern.search(self._clean, self._pos)
+        if match:
+            self._pos = match.end()
+            return True
+        if width is not None:
+            # A later match must end inside text that has not arrived yet
+            self._pos = max(self._pos, len(self._clean) - width + 1)
+        return False
+
 
 class MUDClient:
     """
@@ -111,7 +278,9 @@ class MUDClient:
     FAST_COMMAND_TIMEOUT = 1.0  # For quick commands like look, score, inv
     SELECT_POLL_INTERVAL = 0.05  # 50ms - much faster than old 100ms sleep
     READ_DELAY = 0.1  # Reduced from 0.3
+    GREETING_TIMEOUT = 0.5  # Max wait for the banner in connect()
     READ_CHUNK_SIZE = 4096
+    RECV_BUFFER_SIZE = 65536  # Initial size of the reusable receive buffer
 
     def __init__(
         self,
@@ -141,9 +310,20 @@ class MUDClient:
         self.auto_reconnect = auto_reconnect
 
         self._socket: Optional[socket.socket] = None
+        # Readiness waits go through the platform's best selector (epoll/kqueue)
+        self._sel = selectors.DefaultSelector()
+        self._recv_buf = bytearray(self.RECV_BUFFER_SIZE)
+        # Holds an IAC sequence split across reads until it is complete
+        self._telnet = IncrementalTelnetStripper()
         self._state = ConnectionState.DISCONNECTED
         self._buffer = ""
         self._login_config: Optional[LoginConfig] = None
+        # time.monotonic() of the last send or read, e.g. for
+        # SessionManager's idle timeout
+        self.last_activity = time.monotonic()
+        # Called as on_state_change(client, new_state) after every state
+        # change, e.g. by SessionManager to keep its connection counts
+        self.on_state_change: Optional[Callable[["MUDClient", ConnectionState], None]] = None
 
     def __enter__(self) -> "MUDClient":
         """Context manager entry - connects automatically."""
@@ -165,6 +345,15 @@ class MUDClient:
         """Whether client is connected to server."""
         return self._socket is not None and self._state != ConnectionState.DISCONNECTED
 
+    def _set_state(self, state: ConnectionState) -> None:
+        """Change state, notifying on_state_change if it actually changed."""
+        if state is self._state:
+            return
+        self._state = state
+        callback = self.on_state_change
+        if callback is not None:
+            callback(self, state)
+
     @property
     def is_in_game(self) -> bool:
         """Whether client is logged in and in-game."""
@@ -177,34 +366,31 @@ class MUDClient:
         Returns:
             True if connection successful, False otherwise
         """
+        self._drop_socket()
         try:
             self._socket = socket.create_connection(
                 (self.host, self.port),
                 timeout=self.timeout
             )
             self._socket.setblocking(False)
-            self._state = ConnectionState.CONNECTED
+            self._sel.register(self._socket, selectors.EVENT_READ)
+            self._set_state(ConnectionState.CONNECTED)
 
-            # Read initial greeting/banner using select() instead of hard sleep
-            greeting = self._read_with_select(timeout=0.5)
-            self.logger.debug(f"Greeting: {greeting[:200] if greeting else '(empty)'}...")
+            # Read initial greeting/banner - returns once the server goes quiet
+            greeting = self._read_with_select(timeout=self.GREETING_TIMEOUT)
+            self.logger.debug("Greeting: %s...", greeting[:200] or "(empty)")
 
-            self.logger.info(f"Connected to {self.host}:{self.port}")
+            self.logger.info("Connected to %s:%s", self.host, self.port)
             return True
 
         except Exception as e:
-            self.logger.error(f"Connection failed: {e}")
+            self.logger.error("Connection failed: %s", e)
             return False
 
     def disconnect(self) -> None:
         """Clean disconnect from server."""
-        if self._socket:
-            try:
-                self._socket.close()
-            except:
-                pass
-            self._socket = None
-        self._state = ConnectionState.DISCONNECTED
+        self._drop_socket()
+        self._set_state(ConnectionState.DISCONNECTED)
         self.logger.info("Disconnected")
 
     def reconnect(self) -> bool:
@@ -250,20 +436,19 @@ class MUDClient:
         Returns:
             True if login successful, False otherwise
         """
-        self._state = ConnectionState.AUTHENTICATING
+        self._set_state(ConnectionState.AUTHENTICATING)
         self._login_config = config  # Store for auto-reconnect
 
         try:
-            for prompt_pattern, response_text in config.steps:
-                # Wait for the expected prompt
-                found, output = self.wait_for_pattern(
-                    prompt_pattern,
-                    timeout=self.timeout,
-                    regex=True
-                )
+            matcher = _PatternMatcher()
+            for (prompt_pattern, response_text), (step_re, width) in zip(
+                config.steps, config.compiled_steps
+            ):
+                # Wait for the expected prompt, continuing after the last one
+                found, _ = self._wait_for(matcher, step_re, width, self.timeout)
 
                 if not found:
-                    self.logger.warning(f"Did not see expected prompt: {prompt_pattern}")
+                    self.logger.warning("Did not see expected prompt: %s", prompt_pattern)
                     # Continue anyway - some MUDs don't wait for input
 
                 # Send the response
@@ -274,25 +459,25 @@ class MUDClient:
             clean = clean_output(final_output)
 
             # Check for failure patterns
-            for pattern in config.failure_patterns:
-                if re.search(pattern, clean):
-                    self.logger.error(f"Login failed - matched: {pattern}")
+            for pattern in config.compiled_failure_patterns:
+                if pattern.search(clean):
+                    self.logger.error("Login failed - matched: %s", pattern.pattern)
                     return False
 
             # Check for success patterns
-            for pattern in config.success_patterns:
-                if re.search(pattern, clean):
-                    self._state = ConnectionState.IN_GAME
+            for pattern in config.compiled_success_patterns:
+                if pattern.search(clean):
+                    self._set_state(ConnectionState.IN_GAME)
                     self.logger.info("Login successful")
                     return True
 
             # No explicit success pattern, but also no failure
-            self._state = ConnectionState.IN_GAME
+            self._set_state(ConnectionState.IN_GAME)
             self.logger.info("Login completed (no explicit success pattern)")
             return True
 
         except Exception as e:
-            self.logger.error(f"Login failed: {e}")
+            self.logger.error("Login failed: %s", e)
             return False
 
     def send_command(
@@ -322,31 +507,93 @@ class MUDClient:
         start = time.time()
         self.send_raw(f"{command}\n")
 
-        # Use select() for efficient waiting instead of sleep-polling
-        response = ""
+        # Wait on the selector instead of sleep-polling.
+        # Raw bytes accumulate in a bytearray and are decoded once at the end.
+        buf = bytearray()
+        detected = False
         while time.time() - start < wait_time:
             remaining = wait_time - (time.time() - start)
-            poll_time = min(self.SELECT_POLL_INTERVAL, remaining)
 
             if self._socket is None:
                 break
 
-            # Wait for data to be available (or timeout)
-            readable, _, _ = select.select([self._socket], [], [], poll_time)
-
-            if readable:
-                chunk = self._read_available()
+            # Block until data arrives (or timeout)
+            if self._wait_readable(remaining):
+                chunk = self._read_available_bytes()
                 if chunk:
-                    response += chunk
+                    buf += chunk
                     # If we see a prompt, we're done immediately
-                    if self._detect_prompt(response):
+                    if self._detect_prompt_bytes(buf):
+                        detected = True
                         break
 
         return MUDResponse(
-            raw=response,
-            prompt_detected=self._detect_prompt(response)
+            raw=buf.decode('utf-8', errors='replace'),
+            prompt_detected=detected
         )
 
+    def send_commands(
+        self,
+        commands: List[str],
+        wait_time: float = None,
+        fast: bool = False,
+    ) -> List[MUDResponse]:
+        """
+        Send several commands in one write and split the output by prompt.
+
+        N commands cost about one round trip instead of N. Output is cut
+        into one response each time a read ends in a prompt, so this
+        relies on the MUD answering every command with its own prompt.
+        Responses that arrive merged into a single read can't be told
+        apart: that output goes to the earliest unanswered command, and
+        commands left without output get an empty response.
+
+        Args:
+            commands: Commands to send, in order
+            wait_time: Time to wait for each response (default: DEFAULT_COMMAND_TIMEOUT)
+            fast: Use shorter timeout for quick commands (look, score, inv, etc.)
+
+        Returns:
+            One MUDResponse per command, in order
+        """
+        if not self.ensure_connected():
+            self.logger.error("Not connected and could not reconnect")
+            return [MUDResponse(raw="", prompt_detected=False) for _ in commands]
+
+        if wait_time is None:
+            wait_time = self.FAST_COMMAND_TIMEOUT if fast else self.DEFAULT_COMMAND_TIMEOUT
+
+        self.send_raw("".join(f"{command}\n" for command in commands))
+
+        responses = []
+        buf = bytearray()
+        # Each response gets a full wait_time, counted from the previous one
+        deadline = time.time() + wait_time
+        while len(responses) < len(commands) and self._socket is not None:
+            remaining = deadline - time.time()
+            if remaining <= 0 or not self._wait_readable(remaining):
+                break
+            chunk = self._read_available_bytes()
+            if not chunk:
+                continue
+            buf += chunk
+            if self._detect_prompt_bytes(buf):
+                responses.append(MUDResponse(
+                    raw=buf.decode('utf-8', errors='replace'),
+                    prompt_detected=True
+                ))
+                buf = bytearray()
+                deadline = time.time() + wait_time
+
+        if buf:
+            responses.append(MUDResponse(
+                raw=buf.decode('utf-8', errors='replace'),
+                prompt_detected=False
+            ))
+        while len(responses) < len(commands):
+            responses.append(MUDResponse(raw="", prompt_detected=False))
+        return responses
+
     def send_raw(self, data: str) -> None:
         """
         Send raw data to server without waiting for response.
@@ -355,8 +602,9 @@ class MUDClient:
             data: Raw string to send (include \\n for newlines)
         """
         if self._socket:
+            self.last_activity = time.monotonic()
             self._socket.sendall(data.encode('utf-8'))
-            self.logger.debug(f"Sent: {repr(data)}")
+            self.logger.debug("Sent: %r", data)
 
     def read_available(self) -> MUDResponse:
         """Read all immediately available data from server."""
@@ -380,70 +628,126 @@ class MUDClient:
         Returns:
             Tuple of (found: bool, accumulated_output: str)
         """
-        start = time.time()
-        accumulated = ""
+        compiled, width = _compile_wait_pattern(pattern, regex)
+        return self._wait_for(_PatternMatcher(), compiled, width, timeout)
 
+    def _wait_for(
+        self,
+        matcher: _PatternMatcher,
+        pattern: Pattern,
+        width: Optional[int],
+        timeout: float,
+    ) -> Tuple[bool, str]:
+        """Feed socket output to matcher until pattern is found or timeout."""
+        buf = bytearray()
+        # Output left over from an earlier wait may already contain it
+        if matcher.search(pattern, width):
+            return True, ""
+
+        start = time.time()
         while time.time() - start < timeout:
             remaining = timeout - (time.time() - start)
-            poll_time = min(self.SELECT_POLL_INTERVAL, remaining)
 
             if self._socket is None:
                 break
 
-            # Use select() instead of sleep-polling
-            readable, _, _ = select.select([self._socket], [], [], poll_time)
-
-            if readable:
-                chunk = self._read_available()
-                accumulated += chunk
-
-                clean = clean_output(accumulated)
+            # Block until data arrives (or timeout)
+            if self._wait_readable(remaining):
+                chunk = self._read_available_bytes()
+                buf += chunk
+                matcher.feed(chunk)
+                if matcher.search(pattern, width):
+                    return True, buf.decode('utf-8', errors='replace')
 
-                if regex:
-                    if re.search(pattern, clean, re.IGNORECASE):
-                        return True, accumulated
-                else:
-                    if pattern.lower() in clean.lower():
-                        return True, accumulated
-
-        return False, accumulated
+        return False, buf.decode('utf-8', errors='replace')
 
     def _read_available(self) -> str:
         """Read all immediately available data from socket."""
+        return self._read_available_bytes().decode('utf-8', errors='replace')
+
+    def _read_available_bytes(self) -> bytes:
+        """Read all immediately available data from socket, undecoded."""
         if not self._socket:
-            return ""
+            return b""
 
-        data = b""
+        self.last_activity = time.monotonic()
+        buf = self._recv_buf
+        view = memoryview(buf)
+        off = 0
         try:
             while True:
-                chunk = self._socket.recv(self.READ_CHUNK_SIZE)
-                if not chunk:
-                    # Empty bytes means server closed the connection
+                if off == len(buf):
+                    # Buffer full - release the view so the bytearray can grow
+                    view.release()
+                    buf.extend(bytes(len(buf)))
+                    view = memoryview(buf)
+                n = self._socket.recv_into(view[off:])
+                if not n:
+                    # Zero bytes means server closed the connection
                     self.logger.info("Server closed connection")
-                    self._state = ConnectionState.DISCONNECTED
-                    self._socket = None
+                    self._set_state(ConnectionState.DISCONNECTED)
+                    self._drop_socket()
                     break
-                data += chunk
-        except BlockingIOError:
+                off += n
+        except (BlockingIOError, InterruptedError):
             pass  # No more data available
         except ConnectionResetError:
             self.logger.info("Connection reset by server")
-            self._state = ConnectionState.DISCONNECTED
-            self._socket = None
-        except Exception as e:
-            self.logger.debug(f"Read error (often normal): {e}")
-
-        result = data.decode('utf-8', errors='replace')
+            self._set_state(ConnectionState.DISCONNECTED)
+            self._drop_socket()
+        finally:
+            # Copy out and release even if an unexpected error propagates
+            data = bytes(view[:off])
+            view.release()
+
+        # Strip telnet negotiation while the IAC bytes are still intact
+        result = self._telnet.feed(data)
         if result:
-            self.logger.debug(f"Read {len(result)} bytes")
+            self.logger.debug("Read %d bytes", len(result))
         return result
 
+    def _wait_readable(self, timeout: float) -> bool:
+        """Block until the socket is readable or timeout elapses."""
+        return bool(self._sel.select(timeout))
+
+    def _reset(self) -> None:
+        """
+        Return the client to its just-constructed, disconnected state.
+
+        The selector and receive buffer are kept, so a client can be
+        reused (see SessionManager's client pool) without allocating
+        them again.
+        """
+        self._drop_socket()
+        self._set_state(ConnectionState.DISCONNECTED)
+        self._buffer = ""
+        self._login_config = None
+        self.last_activity = time.monotonic()
+        # Give back memory a large response made the buffer grow by
+        del self._recv_buf[self.RECV_BUFFER_SIZE:]
+
+    def _drop_socket(self) -> None:
+        """Unregister and close the socket, if any."""
+        if self._socket is None:
+            return
+        self._telnet.reset()
+        try:
+            self._sel.unregister(self._socket)
+        except (KeyError, ValueError):
+            pass
+        try:
+            self._socket.close()
+        except OSError:
+            pass
+        self._socket = None
+
     def _read_with_select(self, timeout: float = 0.5) -> str:
         """
-        Read data using select() - returns when data arrives or timeout.
+        Read data using the selector until timeout, or until data has
+        arrived and then stopped for SELECT_POLL_INTERVAL.
 
-        More efficient than sleep + read_available because it wakes up
-        immediately when data is available.
+        Waits for the first byte in a single blocking select, so it wakes
+        up as soon as the server sends anything.
         """
         if not self._socket:
             return ""
@@ -453,10 +757,13 @@ class MUDClient:
 
         while time.time() - start < timeout:
             remaining = timeout - (time.time() - start)
-            poll_time = min(self.SELECT_POLL_INTERVAL, remaining)
+            # Block until the first byte; after that, a short silence ends the read
+            poll_time = min(self.SELECT_POLL_INTERVAL, remaining) if result else remaining
+
+            if self._socket is None:
+                break
 
-            readable, _, _ = select.select([self._socket], [], [], poll_time)
-            if readable:
+            if self._wait_readable(poll_time):
                 chunk = self._read_available()
                 if chunk:
                     result += chunk
@@ -468,28 +775,57 @@ class MUDClient:
 
         return result
 
+    def _detect_prompt_bytes(self, buf: bytearray) -> bool:
+        """_detect_prompt() on a raw byte buffer, decoding only what it needs."""
+        if self.prompt_config.custom_detector:
+            return self._detect_prompt(buf.decode('utf-8', errors='replace'))
+        # Up to 4 UTF-8 bytes per character covers tail_chars characters
+        tail = buf[-4 * self.prompt_config.tail_chars:]
+        return self._detect_prompt(tail.decode('utf-8', errors='replace'))
+
     def _detect_prompt(self, text: str) -> bool:
         """
         Detect if text ends with a MUD prompt.
 
         Uses the configured PromptConfig to detect prompts.
         """
-        # Custom detector takes precedence
-        if self.prompt_config.custom_detector:
-            return self.prompt_config.custom_detector(text)
+        return _detect_prompt(self.prompt_config, text)
 
-        clean = clean_output(text).rstrip()
 
-        # Check simple end characters
-        if clean and clean[-1] in self.prompt_config.end_chars:
-            return True
+def _detect_prompt(prompt_config: PromptConfig, text: str) -> bool:
+    """Prompt detection shared by MUDClient and AsyncMUDClient."""
+    # Custom detector takes precedence
+    if prompt_config.custom_detector:
+        return prompt_config.custom_detector(text)
 
-        # Check regex patterns
-        for pattern in self.prompt_config.patterns:
-            if re.search(pattern, clean):
-                return True
+    # Cheap check first: a bare prompt character at the very end of the
+    # raw text needs no cleaning (escape sequences never end in one)
+    end = text[-8:].rstrip()
+    if end and end[-1] in prompt_config.end_chars:
+        return True
 
-        return False
+    # Prompts sit at the end of the output - only the tail needs checking
+    tail = text[-prompt_config.tail_chars:]
+    if '\x1b' in tail:
+        clean = clean_output(tail).rstrip()
+    else:
+        # No escape sequences (telnet codes are stripped before decoding),
+        # so only CRs and bells can be left - skip the regex pass
+        clean = tail.replace('\r', '').replace('\x07', '').rstrip()
+
+    # Check simple end characters
+    if clean and clean[-1] in prompt_config.end_chars:
+        return True
+
+    # Check regex patterns
+    combined = prompt_config.combined_pattern
+    if combined is not None:
+        return combined.search(clean) is not None
+    for pattern in prompt_config.compiled_patterns:
+        if pattern.search(clean):
+            return True
+
+    return False
 
 
 def quick_connect(
@@ -0,0 +1,179 @@
+"""
+MUDHost - Drive many async MUD connections concurrently.
+
+Holds a set of named AsyncMUDClient connections on one event loop and
+fans commands out to them with asyncio.gather, so N sessions cost the
+slowest round trip instead of the sum of all of them.
+"""
+
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+from typing import Dict, Iterable, Optional
+
+from .aclient import AsyncMUDClient
+from .response import MUDResponse
+from .session import _STATE_NAMES, SessionConfig
+
+
+class MUDHost:
+    """
+    Pool of named AsyncMUDClient connections.
+
+    Usage:
+        async with MUDHost() as host:
+            await host.connect_all({
+                "player1": SessionConfig("localhost", 4000, login_config=login1),
+                "player2": SessionConfig("localhost", 4000, login_config=login2),
+            })
+            responses = await host.broadcast("look")
+            print(responses["player1"].clean)
+            await host.ensure_all_connected()  # Reconnect any drops
+        # All connections closed
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the host.
+
+        Args:
+            logger: Optional logger instance, shared by all clients
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.clients: Dict[str, AsyncMUDClient] = {}
+        self._stack = AsyncExitStack()
+
+    async def __aenter__(self) -> "MUDHost":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - closes every connection."""
+        await self.close()
+        return None
+
+    async def connect(self, name: str, config: SessionConfig) -> bool:
+        """
+        Open a named connection and log in if configured.
+
+        Args:
+            name: Unique identifier for this connection
+            config: Connection settings (host, port, login, prompts)
+
+        Returns:
+            True if connected (and logged in, if login_config is set)
+
+        Raises:
+            ValueError: If name is already connected
+        """
+        if name in self.clients:
+            raise ValueError(f"Client '{name}' already exists. Use close() first.")
+
+        client = AsyncMUDClient(
+            host=config.host,
+            port=config.port,
+            timeout=config.timeout,
+            prompt_config=config.prompt_config,
+            logger=self.logger,
+            auto_reconnect=config.auto_reconnect,
+        )
+
+        if not await client.connect():
+            return False
+
+        if config.login_config and not await client.login(config.login_config):
+            await client.disconnect()
+            return False
+
+        self._stack.push_async_callback(client.disconnect)
+        self.clients[name] = client
+        return True
+
+    async def connect_all(self, configs: Dict[str, SessionConfig]) -> Dict[str, bool]:
+        """
+        Open several connections concurrently.
+
+        Args:
+            configs: Mapping of name to connection settings
+
+        Returns:
+            Mapping of name to whether that connection succeeded
+        """
+        names = list(configs)
+        results = await asyncio.gather(
+            *(self.connect(name, configs[name]) for name in names)
+        )
+        return dict(zip(names, results))
+
+    async def send(self, name: str, command: str, **kwargs) -> MUDResponse:
+        """
+        Send a command to one connection.
+
+        Args:
+            name: Connection to use
+            command: Command to send
+            **kwargs: Passed to AsyncMUDClient.send_command (wait_time, fast)
+
+        Raises:
+            KeyError: If no connection has that name
+        """
+        return await self.clients[name].send_command(command, **kwargs)
+
+    async def broadcast(
+        self,
+        command: str,
+        names: Optional[Iterable[str]] = None,
+        **kwargs,
+    ) -> Dict[str, MUDResponse]:
+        """
+        Send the same command to several connections at once.
+
+        Args:
+            command: Command to send
+            names: Connections to use (default: all)
+            **kwargs: Passed to AsyncMUDClient.send_command (wait_time, fast)
+
+        Returns:
+            Mapping of name to that connection's response
+        """
+        names = list(self.clients if names is None else names)
+        responses = await asyncio.gather(
+            *(self.clients[name].send_command(command, **kwargs) for name in names)
+        )
+        return dict(zip(names, responses))
+
+    async def ensure_all_connected(self) -> Dict[str, bool]:
+        """
+        Reconnect any dropped connections, all at once.
+
+        Returns:
+            Mapping of name to whether that connection is now up
+        """
+        names = list(self.clients)
+        results = await asyncio.gather(
+            *(self.clients[name].ensure_connected() for name in names)
+        )
+        return dict(zip(names, results))
+
+    def status(self) -> Dict[str, Dict]:
+        """
+        Get status of all connections (same shape as SessionManager.status()).
+
+        Returns:
+            Dict mapping connection names to status info
+        """
+        return {
+            name: {
+                "connected": client.is_connected,
+                "in_game": client.is_in_game,
+                "state": _STATE_NAMES[client.state],
+                "host": client.host,
+                "port": client.port,
+            }
+            for name, client in self.clients.items()
+        }
+
+    async def close(self) -> None:
+        """Disconnect every connection."""
+        await self._stack.aclose()
+        self.clients.clear()
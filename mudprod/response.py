@@ -2,33 +2,65 @@
 MUDResponse - Structured response from MUD server commands.
 """
 
-from dataclasses import dataclass, field
-from typing import List
+from functools import cached_property
+from typing import List, Optional
 
 from .ansi import clean_output
 
 
-@dataclass
 class MUDResponse:
     """
     Structured response from the MUD server.
 
+    clean and lines are computed on first access, so a response that is
+    only checked for raw or prompt_detected never pays for ANSI stripping.
+
     Attributes:
-        raw: Raw server output with ANSI codes and telnet sequences
+        raw: Raw server output with ANSI codes (telnet negotiation removed)
         clean: Cleaned output (ANSI stripped, normalized)
         prompt_detected: Whether a prompt was detected at the end
         lines: Non-empty lines from the cleaned output
     """
-    raw: str
-    clean: str = field(default="")
-    prompt_detected: bool = False
-    lines: List[str] = field(default_factory=list)
-
-    def __post_init__(self):
-        if not self.clean:
-            self.clean = clean_output(self.raw)
-        if not self.lines:
-            self.lines = [line for line in self.clean.split('\n') if line.strip()]
+
+    def __init__(
+        self,
+        raw: str,
+        clean: str = "",
+        prompt_detected: bool = False,
+        lines: Optional[List[str]] = None,
+    ):
+        self.raw = raw
+        self.prompt_detected = prompt_detected
+        # Precomputed values take the place of the lazy properties
+        if clean:
+            self.clean = clean
+        if lines:
+            self.lines = lines
+
+    @cached_property
+    def clean(self) -> str:
+        """Cleaned output (ANSI stripped, normalized)."""
+        return clean_output(self.raw)
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Non-empty lines from the cleaned output."""
+        return [line for line in self.clean.split('\n') if line and not line.isspace()]
+
+    def _fields(self) -> tuple:
+        """The public fields, as compared by __eq__."""
+        return (self.raw, self.clean, self.prompt_detected, self.lines)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __repr__(self) -> str:
+        return (
+            f"MUDResponse(raw={self.raw!r}, clean={self.clean!r}, "
+            f"prompt_detected={self.prompt_detected!r}, lines={self.lines!r})"
+        )
 
     def __contains__(self, item: str) -> bool:
         """Allow 'text in response' syntax."""
@@ -7,23 +7,189 @@ allowing agents to pilot a MUD over many turns without reconnecting.
 
 import json
 import os
+import re
+import selectors
 import socket
 import threading
 import time
 import logging
 import signal
+import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Pattern
 from dataclasses import asdict
 
-from .client import MUDClient, LoginConfig, PromptConfig
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .client import MUDClient, LoginConfig, PromptConfig, _BACKREF_PATTERN
+from .response import MUDResponse
 from .session import SessionManager, SessionConfig
 
 
 DEFAULT_SOCKET_PATH = "/tmp/mudprod.sock"
 DEFAULT_PID_FILE = "/tmp/mudprod.pid"
 
+# Each message is a 4-byte big-endian length followed by that much JSON
+_FRAME_HEADER = struct.Struct(">I")
+
+# Largest frame sent or accepted. A bad length prefix would otherwise
+# have the receiver allocate up to 4 GiB before reading anything.
+_MAX_FRAME = 16 * 1024 * 1024
+
+
+class _FrameTooLarge(ValueError):
+    """A message is over _MAX_FRAME bytes."""
+
+
+if orjson is not None:
+    # orjson (pip install "mudprod[orjson]") encodes straight to bytes and
+    # decodes from any buffer, several times faster on large responses
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(message: Dict[str, Any]) -> bytes:
+        return json.dumps(message).encode("utf-8")
+
+    def _loads(data: memoryview) -> Dict[str, Any]:
+        return json.loads(str(data, "utf-8"))
+
+
+def _encode_frame(message: Dict[str, Any]) -> bytes:
+    """Encode one message as a length-prefixed JSON frame."""
+    payload = _dumps(message)
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+# Constant replies, encoded once at import. Handlers return these exact
+# objects and _send_frame() writes the prebuilt bytes for them.
+_OK = {"success": True}
+_NOT_CONNECTED = {"success": False, "error": "Not connected"}
+_PREBUILT_FRAMES = {id(reply): _encode_frame(reply) for reply in (_OK, _NOT_CONNECTED)}
+
+
+def _send_frame(sock: socket.socket, message: Dict[str, Any]) -> None:
+    """Send one length-prefixed JSON message."""
+    frame = _PREBUILT_FRAMES.get(id(message))
+    if frame is not None:
+        sock.sendall(frame)
+        return
+
+    payload = _dumps(message)
+    if len(payload) > _MAX_FRAME:
+        raise _FrameTooLarge(f"Message of {len(payload)} bytes exceeds {_MAX_FRAME}")
+    header = _FRAME_HEADER.pack(len(payload))
+    # Header and payload go out in one gathered write, without first
+    # copying the payload into a concatenated frame
+    sent = sock.sendmsg((header, payload))
+    if sent < len(header):
+        sock.sendall(header[sent:])
+        sock.sendall(payload)
+    elif sent < len(header) + len(payload):
+        sock.sendall(memoryview(payload)[sent - len(header):])
+
+
+# MUDResponse attributes a request may ask for with "fields"
+RESPONSE_FIELDS = ("raw", "clean", "lines", "prompt_detected")
+
+
+def _project_response(
+    response: MUDResponse,
+    request: Dict[str, Any],
+    default: tuple,
+) -> Dict[str, Any]:
+    """
+    The MUDResponse attributes a request asked for, as a dict.
+
+    Requests may pass "fields" (any of RESPONSE_FIELDS) to get only what
+    they use; since clean and lines are computed lazily, fields that
+    aren't asked for cost nothing. Without "fields", default is used.
+    """
+    fields = request.get("fields") or default
+    return {f: getattr(response, f) for f in fields if f in RESPONSE_FIELDS}
+
+
+# Commands that talk to a session's MUD connection; these run under the
+# session's lock so concurrent requests for it don't interleave
+_SESSION_COMMANDS = frozenset(
+    ("connect", "send", "send_raw", "read", "peek", "batch", "disconnect")
+)
+
+
+# Output that fires a session's repeat command
+BALANCE_TOKEN = "You have recovered balance"
+
+
+def _build_trigger_union(triggers: List[tuple], repeat: bool = False) -> Optional[Pattern]:
+    """
+    Fuse a session's trigger patterns (and BALANCE_TOKEN, when a repeat
+    command is set) into one alternation.
+
+    Lets the common case - output that fires nothing - be ruled out in a
+    single scan instead of one per trigger. None if there is only one
+    thing to look for or the patterns can't be combined (backreferences,
+    inline global flags); callers then check each one directly.
+    """
+    for compiled, _, pattern in triggers:
+        # Inline global flags would apply to the whole union (and only
+        # raise re.error from Python 3.11); backreferences get renumbered
+        if compiled.flags & ~(re.IGNORECASE | re.UNICODE) or _BACKREF_PATTERN.search(pattern):
+            return None
+    patterns = [pattern for _, _, pattern in triggers]
+    if repeat:
+        patterns.append(re.escape(BALANCE_TOKEN))
+    if len(patterns) < 2:
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    except re.error:
+        return None
+
+
+# Initial size of the per-connection receive buffer
+_RECV_BUFFER_SIZE = 8192
+
+
+def _recv_exact_into(sock: socket.socket, view: memoryview) -> bool:
+    """Fill view from the socket; False if the peer closes first."""
+    while view:
+        n = sock.recv_into(view)
+        if not n:
+            return False
+        view = view[n:]
+    return True
+
+
+def _recv_frame(sock: socket.socket, buf: bytearray) -> Optional[Dict[str, Any]]:
+    """
+    Read one length-prefixed JSON message, or None at end of stream.
+
+    The message is received straight into buf, a buffer reused across
+    calls on the same connection, which grows (doubling) to fit larger
+    messages.
+
+    Raises:
+        _FrameTooLarge: If the length prefix is over _MAX_FRAME; the
+            message is left unread, so the connection can't be reused
+    """
+    if not _recv_exact_into(sock, memoryview(buf)[:_FRAME_HEADER.size]):
+        return None
+    (size,) = _FRAME_HEADER.unpack_from(buf)
+    if size > _MAX_FRAME:
+        raise _FrameTooLarge(f"Message of {size} bytes exceeds {_MAX_FRAME}")
+
+    if size > len(buf):
+        buf.extend(bytes(max(size, 2 * len(buf)) - len(buf)))
+
+    payload = memoryview(buf)[:size]
+    if not _recv_exact_into(sock, payload):
+        return None
+    return _loads(payload)
+
 
 class SessionServer:
     """
@@ -40,27 +206,86 @@ class SessionServer:
         # From another process, use SessionClient to send commands
     """
 
+    # Pending-connection queue length; bursts from many agents overflowed 5
+    LISTEN_BACKLOG = 128
+
     def __init__(
         self,
         socket_path: str = DEFAULT_SOCKET_PATH,
         pid_file: str = DEFAULT_PID_FILE,
         logger: Optional[logging.Logger] = None,
+        max_workers: int = 16,
     ):
+        """
+        Initialize the session server.
+
+        Args:
+            socket_path: Unix socket to listen on
+            pid_file: Where to write the server PID
+            logger: Optional logger instance
+            max_workers: Requests served at once; idle SessionClient
+                connections wait in the accept loop, not on a worker
+        """
         self.socket_path = socket_path
         self.pid_file = pid_file
         self.logger = logger or logging.getLogger(__name__)
         self.manager = SessionManager(logger=self.logger)
         self._server_socket: Optional[socket.socket] = None
         self._running = False
-        # Triggers: session_name -> list of (pattern, command)
+        self._shutdown_requested = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mudprod-client"
+        )
+        # Guards _clients, _served, _triggers, _repeat_commands and
+        # _monitor_threads, which client workers, the accept loop and
+        # monitor threads touch concurrently
+        self._lock = threading.Lock()
+        # Open client connections, closed on shutdown
+        self._clients: set = set()
+        # Connections whose request has been answered, waiting for the
+        # accept loop to watch them again
+        self._served: List[socket.socket] = []
+        # Accept loop selector: listening socket, self-pipe, idle clients
+        self._sel: Optional[selectors.BaseSelector] = None
+        # Per-worker receive buffer
+        self._local = threading.local()
+        # Triggers: session_name -> list of (compiled pattern, command, pattern)
         self._triggers: Dict[str, list] = {}
+        # Each session's trigger patterns and balance token as one regex
+        # (see _build_trigger_union)
+        self._trigger_unions: Dict[str, Optional[Pattern]] = {}
         # Repeat commands: session_name -> command to repeat on balance
         self._repeat_commands: Dict[str, str] = {}
         # Background monitor threads
         self._monitor_threads: Dict[str, threading.Thread] = {}
+        # Self-pipe that wakes the accept loop on shutdown
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        # Request "command" -> handler, built once rather than walking an
+        # if/elif chain on every request
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "connect": self._cmd_connect,
+            "send": self._cmd_send,
+            "send_raw": self._cmd_send_raw,
+            "read": self._cmd_read,
+            "peek": self._cmd_peek,
+            "batch": self._cmd_batch,
+            "status": self._cmd_status,
+            "disconnect": self._cmd_disconnect,
+            "repeat": self._cmd_repeat,
+            "trigger": self._cmd_trigger,
+            "triggers": self._cmd_triggers,
+            "shutdown": self._cmd_shutdown,
+        }
 
-    def start(self) -> None:
-        """Start the server and listen for commands."""
+    def start(self, on_ready: Optional[Callable[[], None]] = None) -> None:
+        """
+        Start the server and listen for commands.
+
+        Args:
+            on_ready: Called once the socket is listening, before the
+                first connection is accepted
+        """
         # Clean up old socket
         if os.path.exists(self.socket_path):
             os.unlink(self.socket_path)
@@ -76,35 +301,123 @@ class SessionServer:
         # Create Unix socket
         self._server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         self._server_socket.bind(self.socket_path)
-        self._server_socket.listen(5)
+        self._server_socket.listen(self.LISTEN_BACKLOG)
+        self._server_socket.setblocking(False)
+
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
+        # Block until a client connects or sends a request, or shutdown is
+        # requested - no polling
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self._server_socket, selectors.EVENT_READ)
+        self._sel.register(self._wake_r, selectors.EVENT_READ)
         self._running = True
 
         self.logger.info(f"Session server started on {self.socket_path}")
+        if on_ready is not None:
+            on_ready()
 
         try:
             while self._running:
-                try:
-                    self._server_socket.settimeout(1.0)
-                    client_socket, _ = self._server_socket.accept()
-                    self._handle_client(client_socket)
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    if self._running:
-                        self.logger.error(f"Error accepting connection: {e}")
+                for key, _ in self._sel.select():
+                    if key.fileobj is self._server_socket:
+                        self._accept_pending()
+                    elif key.fileobj is self._wake_r:
+                        self._drain_wake_pipe()
+                        self._watch_served()
+                    else:
+                        # A request arrived: stop watching the connection
+                        # while a worker serves it
+                        self._sel.unregister(key.fileobj)
+                        self._executor.submit(self._handle_client, key.fileobj)
         finally:
             self._cleanup()
 
+    def _accept_pending(self) -> None:
+        """Accept every queued connection and watch it for requests."""
+        # Drain the whole backlog per wakeup so a burst of connects costs
+        # one select() rather than one per client
+        while True:
+            try:
+                client_socket, _ = self._server_socket.accept()
+            except BlockingIOError:
+                return  # Queue is empty
+            except Exception as e:
+                if self._running:
+                    self.logger.error(f"Error accepting connection: {e}")
+                return
+
+            client_socket.settimeout(None)
+            with self._lock:
+                self._clients.add(client_socket)
+            self._sel.register(client_socket, selectors.EVENT_READ)
+
+    def _watch_served(self) -> None:
+        """Watch connections handed back by workers for their next request."""
+        with self._lock:
+            served, self._served = self._served, []
+        for client_socket in served:
+            self._sel.register(client_socket, selectors.EVENT_READ)
+
+    def _wake(self) -> None:
+        """Wake the accept loop so it notices _running has changed."""
+        if self._wake_w is None:
+            return
+        try:
+            os.write(self._wake_w, b"x")
+        except (BlockingIOError, OSError):
+            pass  # Pipe full (a wakeup is already pending) or closed
+
+    def _drain_wake_pipe(self) -> None:
+        """Empty the self-pipe after a wakeup."""
+        try:
+            while os.read(self._wake_r, 512):
+                pass
+        except BlockingIOError:
+            pass
+
     def _handle_signal(self, signum, frame) -> None:
         """Handle shutdown signals."""
         self.logger.info(f"Received signal {signum}, shutting down...")
+        self._stop()
+
+    def _stop(self) -> None:
+        """Stop the accept loop; start() then cleans up and returns."""
         self._running = False
+        self._wake()
 
     def _cleanup(self) -> None:
         """Clean up resources."""
+        # Close every client connection. Those being served are only shut
+        # down; their worker closes them.
+        with self._lock:
+            clients = list(self._clients)
+            idle = set(self._served)
+            self._clients.clear()
+            self._served = []
+        idle.update(key.fileobj for key in self._sel.get_map().values())
+        self._sel.close()
+        for client_socket in clients:
+            try:
+                client_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            if client_socket in idle:
+                client_socket.close()
+        if sys.version_info >= (3, 9):
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=False)
         self.manager.close_all()
         if self._server_socket:
             self._server_socket.close()
+        wake_fds = (self._wake_r, self._wake_w)
+        self._wake_r = self._wake_w = None
+        for fd in wake_fds:
+            if fd is not None:
+                os.close(fd)
         if os.path.exists(self.socket_path):
             os.unlink(self.socket_path)
         if os.path.exists(self.pid_file):
@@ -112,64 +425,84 @@ class SessionServer:
         self.logger.info("Server stopped")
 
     def _handle_client(self, client_socket: socket.socket) -> None:
-        """Handle a client connection."""
+        """
+        Serve the request waiting on a client connection.
+
+        Requests and responses are length-prefixed JSON frames, so a
+        client can keep one connection open for many commands. Between
+        requests the connection goes back to the accept loop, so idle
+        clients don't hold a worker.
+        """
+        buf = getattr(self._local, "buf", None)
+        if buf is None:
+            buf = self._local.buf = bytearray(_RECV_BUFFER_SIZE)
+        keep = False
         try:
-            data = b""
-            while True:
-                chunk = client_socket.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                if b"\n" in data:
-                    break
-
-            if data:
-                request = json.loads(data.decode("utf-8"))
-                response = self._process_request(request)
-                client_socket.sendall(json.dumps(response).encode("utf-8"))
-        except Exception as e:
-            self.logger.error(f"Error handling client: {e}")
+            request = response = None
             try:
-                client_socket.sendall(json.dumps({
-                    "success": False,
-                    "error": str(e)
-                }).encode("utf-8"))
-            except:
-                pass
-        finally:
+                request = _recv_frame(client_socket, buf)
+            except _FrameTooLarge as e:
+                # The oversized message is still unread; reply, then close
+                self.logger.error(f"Rejected request: {e}")
+                _send_frame(client_socket, {"success": False, "error": str(e)})
+            except ValueError as e:
+                # Not JSON, but the frame was read in full, so the
+                # connection is still in sync and stays open
+                self.logger.error(f"Invalid request: {e}")
+                response = {"success": False, "error": f"Invalid request: {e}"}
+            if request is not None:
+                try:
+                    response = self._process_request(request)
+                except Exception as e:
+                    self.logger.error(f"Error handling request: {e}")
+                    response = {"success": False, "error": str(e)}
+            if response is not None:
+                try:
+                    _send_frame(client_socket, response)
+                except _FrameTooLarge as e:
+                    self.logger.error(f"Error sending response: {e}")
+                    _send_frame(client_socket, {"success": False, "error": str(e)})
+                if self._shutdown_requested:
+                    self._stop()
+                keep = self._running
+        except Exception as e:
+            if self._running:
+                self.logger.error(f"Error handling client: {e}")
+
+        with self._lock:
+            if keep and client_socket in self._clients:
+                self._served.append(client_socket)
+            else:
+                keep = False
+                self._clients.discard(client_socket)
+        if keep:
+            self._wake()
+        else:
             client_socket.close()
 
     def _process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process a command request."""
         cmd = request.get("command")
 
-        if cmd == "connect":
-            return self._cmd_connect(request)
-        elif cmd == "send":
-            return self._cmd_send(request)
-        elif cmd == "send_raw":
-            return self._cmd_send_raw(request)
-        elif cmd == "read":
-            return self._cmd_read(request)
-        elif cmd == "peek":
-            return self._cmd_peek(request)
-        elif cmd == "batch":
-            return self._cmd_batch(request)
-        elif cmd == "status":
-            return self._cmd_status(request)
-        elif cmd == "disconnect":
-            return self._cmd_disconnect(request)
-        elif cmd == "repeat":
-            return self._cmd_repeat(request)
-        elif cmd == "trigger":
-            return self._cmd_trigger(request)
-        elif cmd == "triggers":
-            return self._cmd_triggers(request)
-        elif cmd == "shutdown":
-            self._running = False
-            return {"success": True, "message": "Server shutting down"}
-        else:
+        handler = self._handlers.get(cmd)
+        if handler is None:
             return {"success": False, "error": f"Unknown command: {cmd}"}
+        if cmd not in _SESSION_COMMANDS:
+            return handler(request)
+
+        # Workers serve connections in parallel; without this, two
+        # requests for one session would read each other's output
+        session_lock = self.manager.session_lock(request.get("session", "default"))
+        if session_lock is None:
+            return handler(request)  # No such session (yet)
+        with session_lock:
+            return handler(request)
+
+    def _cmd_shutdown(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle shutdown command."""
+        # Stopped by _handle_client once this reply has been sent
+        self._shutdown_requested = True
+        return {"success": True, "message": "Server shutting down"}
 
     def _cmd_connect(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle connect command."""
@@ -227,38 +560,63 @@ class SessionServer:
         if not session.is_connected:
             session.reconnect()
             if not session.is_connected:
-                return {"success": False, "error": "Not connected"}
+                return _NOT_CONNECTED
 
         response = session.send_command(text, wait_time=wait_time)
 
         # Check triggers on the response
         self._check_triggers_inline(name, response.raw, session)
 
-        return {
-            "success": True,
-            "raw": response.raw,
-            "clean": response.clean,
-            "lines": response.lines,
-            "prompt_detected": response.prompt_detected,
-        }
+        result = {"success": True}
+        result.update(_project_response(response, request, RESPONSE_FIELDS))
+        return result
 
     def _check_triggers_inline(self, name: str, data: str, session) -> None:
         """Check triggers and fire them (inline, not threaded)."""
-        import re
+        repeat, triggers = self._trigger_state(name, data)
 
         # Check for balance recovery (repeat command)
-        if name in self._repeat_commands:
-            if "You have recovered balance" in data:
-                cmd = self._repeat_commands[name]
+        if repeat is not None:
+            if BALANCE_TOKEN in data:
+                cmd = repeat
                 self.logger.info(f"Balance recovered, queuing: {cmd}")
                 session.send_raw(f"{cmd}\n")
 
         # Check custom triggers
-        for pattern, cmd in self._triggers.get(name, []):
-            if re.search(pattern, data, re.IGNORECASE):
+        for compiled, cmd, pattern in triggers:
+            if compiled.search(data):
                 self.logger.info(f"Trigger matched '{pattern}', sending: {cmd}")
                 session.send_raw(f"{cmd}\n")
 
+    def _trigger_state(self, name: str, data: str) -> tuple:
+        """
+        Snapshot a session's repeat command and the triggers worth checking.
+
+        Returns:
+            Tuple of (repeat command or None, triggers to check against data)
+        """
+        with self._lock:
+            repeat = self._repeat_commands.get(name)
+            triggers = self._triggers.get(name, [])
+            union = self._trigger_unions.get(name)
+
+        # One scan rules out the repeat and every trigger when nothing matches
+        if union is not None and not union.search(data):
+            return None, []
+        return repeat, triggers
+
+    def _set_triggers(self, name: str, triggers: list) -> None:
+        """Replace a session's triggers. Call with _lock held."""
+        self._triggers[name] = triggers
+        self._rebuild_trigger_union(name)
+
+    def _rebuild_trigger_union(self, name: str) -> None:
+        """Refresh a session's fused trigger regex. Call with _lock held."""
+        self._trigger_unions[name] = _build_trigger_union(
+            self._triggers.get(name, []),
+            repeat=name in self._repeat_commands,
+        )
+
     def _cmd_send_raw(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle send_raw command (send without waiting)."""
         name = request.get("session", "default")
@@ -269,7 +627,7 @@ class SessionServer:
             return {"success": False, "error": f"Session '{name}' not found"}
 
         session.send_raw(text)
-        return {"success": True}
+        return _OK
 
     def _cmd_read(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle read command (read available data)."""
@@ -285,21 +643,17 @@ class SessionServer:
         if response.raw:
             self._check_triggers_inline(name, response.raw, session)
 
-        return {
-            "success": True,
-            "raw": response.raw,
-            "clean": response.clean,
-        }
+        result = {"success": True}
+        result.update(_project_response(response, request, ("raw", "clean")))
+        return result
 
     def _cmd_peek(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle peek command - check for data without blocking.
 
-        Unlike 'read', peek uses select() to wait up to max_wait seconds
-        for data to arrive. Returns immediately if data is available.
+        Unlike 'read', peek waits up to max_wait seconds for data to
+        arrive. Returns as soon as anything is available.
         """
-        import select as sel
-
         name = request.get("session", "default")
         max_wait = request.get("max_wait", 0.1)  # Default 100ms
 
@@ -308,51 +662,36 @@ class SessionServer:
             return {"success": False, "error": f"Session '{name}' not found"}
 
         if not session.is_connected or session._socket is None:
-            return {"success": False, "error": "Not connected"}
+            return _NOT_CONNECTED
 
-        # Use select to check if data is available
-        start = time.time()
+        # One blocking wait for readiness, then drain whatever is queued
         data = ""
-
-        while time.time() - start < max_wait:
-            remaining = max_wait - (time.time() - start)
-            poll_time = min(0.05, remaining)
-
-            readable, _, _ = sel.select([session._socket], [], [], poll_time)
-            if readable:
-                chunk = session._read_available()
-                if chunk:
-                    data += chunk
-                    # Check for more data immediately
-                    continue
-            elif data:
-                # Got data and no more coming
-                break
+        if session._wait_readable(max_wait):
+            data = session._read_available()
 
         # Check triggers if we got data
         if data:
             self._check_triggers_inline(name, data, session)
 
-        from .response import MUDResponse
         response = MUDResponse(raw=data)
 
-        return {
-            "success": True,
-            "raw": response.raw,
-            "clean": response.clean,
-            "has_data": bool(data),
-        }
+        result = {"success": True, "has_data": bool(data)}
+        result.update(_project_response(response, request, ("raw", "clean")))
+        return result
 
     def _cmd_batch(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle batch command - send multiple commands and collect responses.
 
-        Reduces round-trip latency by batching multiple commands.
+        Reduces round-trip latency by batching multiple commands. With
+        "pipeline", all commands are sent at once and the output is split
+        by prompt (see MUDClient.send_commands).
         """
         name = request.get("session", "default")
         commands = request.get("commands", [])
         wait_time = request.get("wait_time", 2.0)  # Shorter default for batches
         fast = request.get("fast", False)
+        pipeline = request.get("pipeline", False)
 
         if not commands:
             return {"success": False, "error": "No commands provided"}
@@ -364,18 +703,28 @@ class SessionServer:
         if not session.is_connected:
             session.reconnect()
             if not session.is_connected:
-                return {"success": False, "error": "Not connected"}
+                return _NOT_CONNECTED
+
+        if pipeline:
+            responses = session.send_commands(commands, wait_time=wait_time, fast=fast)
+            # One trigger pass over the whole exchange
+            self._check_triggers_inline(
+                name, "".join(response.raw for response in responses), session
+            )
+        else:
+            responses = []
+            for cmd in commands:
+                response = session.send_command(cmd, wait_time=wait_time, fast=fast)
+                self._check_triggers_inline(name, response.raw, session)
+                responses.append(response)
 
         results = []
-        for cmd in commands:
-            response = session.send_command(cmd, wait_time=wait_time, fast=fast)
-            self._check_triggers_inline(name, response.raw, session)
-            results.append({
-                "command": cmd,
-                "raw": response.raw,
-                "clean": response.clean,
-                "prompt_detected": response.prompt_detected,
-            })
+        for cmd, response in zip(commands, responses):
+            result = {"command": cmd}
+            result.update(_project_response(
+                response, request, ("raw", "clean", "prompt_detected")
+            ))
+            results.append(result)
 
         return {
             "success": True,
@@ -422,15 +771,18 @@ class SessionServer:
 
         if not cmd or cmd.lower() == "off":
             # Stop repeating
-            if name in self._repeat_commands:
-                del self._repeat_commands[name]
+            with self._lock:
+                self._repeat_commands.pop(name, None)
+                self._rebuild_trigger_union(name)
             return {"success": True, "message": "Repeat disabled"}
 
         session = self.manager.get(name)
         if not session:
             return {"success": False, "error": f"Session '{name}' not found"}
 
-        self._repeat_commands[name] = cmd
+        with self._lock:
+            self._repeat_commands[name] = cmd
+            self._rebuild_trigger_union(name)
         return {"success": True, "message": f"Will repeat '{cmd}' on balance recovery"}
 
     def _cmd_trigger(self, request: Dict[str, Any]) -> Dict[str, Any]:
@@ -440,41 +792,52 @@ class SessionServer:
         cmd = request.get("text", "")
         action = request.get("action", "add")
 
+        # Trigger lists are replaced rather than mutated, so readers can
+        # iterate a list they fetched under the lock without holding it
         if action == "clear":
-            self._triggers[name] = []
+            with self._lock:
+                self._set_triggers(name, [])
             return {"success": True, "message": "All triggers cleared"}
 
         if action == "remove":
-            if name in self._triggers:
-                self._triggers[name] = [
-                    (p, c) for p, c in self._triggers[name] if p != pattern
-                ]
+            with self._lock:
+                if name in self._triggers:
+                    self._set_triggers(name, [
+                        t for t in self._triggers[name] if t[2] != pattern
+                    ])
             return {"success": True, "message": f"Trigger for '{pattern}' removed"}
 
         if not pattern or not cmd:
             return {"success": False, "error": "pattern and text required"}
 
-        if name not in self._triggers:
-            self._triggers[name] = []
+        # Compile once here rather than on every chunk of MUD output
+        try:
+            compiled = re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            return {"success": False, "error": f"Invalid pattern '{pattern}': {e}"}
 
-        self._triggers[name].append((pattern, cmd))
+        trigger = (compiled, cmd, pattern)
+        with self._lock:
+            self._set_triggers(name, self._triggers.get(name, []) + [trigger])
         return {"success": True, "message": f"Trigger added: '{pattern}' -> '{cmd}'"}
 
     def _cmd_triggers(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """List triggers for a session."""
         name = request.get("session", "default")
-        triggers = self._triggers.get(name, [])
-        repeat = self._repeat_commands.get(name, None)
+        with self._lock:
+            triggers = self._triggers.get(name, [])
+            repeat = self._repeat_commands.get(name, None)
         return {
             "success": True,
-            "triggers": [{"pattern": p, "command": c} for p, c in triggers],
+            "triggers": [{"pattern": p, "command": c} for _, c, p in triggers],
             "repeat": repeat,
         }
 
     def _start_monitor(self, name: str) -> None:
         """Start background monitor thread for a session."""
-        if name in self._monitor_threads:
-            return  # Already monitoring
+        with self._lock:
+            if name in self._monitor_threads:
+                return  # Already monitoring
 
         session = self.manager.get(name)
         if not session:
@@ -482,7 +845,7 @@ class SessionServer:
 
         def monitor_loop():
             self.logger.info(f"Starting monitor for session '{name}'")
-            while self._running and name in self._repeat_commands or name in self._triggers:
+            while self._running and (name in self._repeat_commands or name in self._triggers):
                 session = self.manager.get(name)
                 if not session or not session.is_connected:
                     time.sleep(0.5)
@@ -498,39 +861,49 @@ class SessionServer:
                 time.sleep(0.1)
 
             self.logger.info(f"Monitor stopped for session '{name}'")
-            if name in self._monitor_threads:
-                del self._monitor_threads[name]
+            with self._lock:
+                self._monitor_threads.pop(name, None)
 
         thread = threading.Thread(target=monitor_loop, daemon=True)
+        with self._lock:
+            if name in self._monitor_threads:
+                return  # Started concurrently
+            self._monitor_threads[name] = thread
         thread.start()
-        self._monitor_threads[name] = thread
 
     def _stop_monitor(self, name: str) -> None:
         """Stop monitoring a session."""
-        if name in self._repeat_commands:
-            del self._repeat_commands[name]
-        if name in self._triggers:
-            del self._triggers[name]
+        with self._lock:
+            self._repeat_commands.pop(name, None)
+            self._triggers.pop(name, None)
+            self._trigger_unions.pop(name, None)
         # Thread will exit on next iteration
 
     def _process_triggers(self, name: str, data: str, session) -> None:
         """Process incoming data against triggers."""
-        import re
+        repeat, triggers = self._trigger_state(name, data)
 
         # Check for balance recovery (repeat command)
-        if name in self._repeat_commands:
-            if "You have recovered balance" in data:
-                cmd = self._repeat_commands[name]
+        if repeat is not None:
+            if BALANCE_TOKEN in data:
+                cmd = repeat
                 self.logger.info(f"Balance recovered, sending: {cmd}")
                 session.send_raw(f"{cmd}\n")
 
         # Check custom triggers
-        for pattern, cmd in self._triggers.get(name, []):
-            if re.search(pattern, data, re.IGNORECASE):
+        for compiled, cmd, pattern in triggers:
+            if compiled.search(data):
                 self.logger.info(f"Trigger matched '{pattern}', sending: {cmd}")
                 session.send_raw(f"{cmd}\n")
 
 
+def _with_fields(request: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Add a "fields" projection to a request if one was given."""
+    if fields:
+        request["fields"] = list(fields)
+    return request
+
+
 class SessionClient:
     """
     Client for communicating with the SessionServer.
@@ -554,24 +927,61 @@ class SessionClient:
 
     def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
         self.socket_path = socket_path
+        # One connection is opened on first use and reused for every request
+        self._sock: Optional[socket.socket] = None
+        self._recv_buf = bytearray(_RECV_BUFFER_SIZE)
+
+    def __enter__(self) -> "SessionClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection to the server (reopened on next request)."""
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
 
     def _send_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Send a request to the server and return the response."""
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        try:
-            sock.connect(self.socket_path)
-            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        """
+        Send a request to the server and return the response.
 
-            data = b""
-            while True:
-                chunk = sock.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
+        If the kept-alive connection turns out to be dead (e.g. the server
+        restarted), reconnects and retries once.
 
-            return json.loads(data.decode("utf-8"))
-        finally:
-            sock.close()
+        Raises:
+            ValueError: If the request or its response is over the
+                frame size limit
+        """
+        for attempt in range(2):
+            if self._sock is None:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    sock.connect(self.socket_path)
+                except OSError:
+                    sock.close()
+                    raise
+                self._sock = sock
+
+            try:
+                _send_frame(self._sock, request)
+                response = _recv_frame(self._sock, self._recv_buf)
+            except ConnectionError:
+                response = None
+            except _FrameTooLarge:
+                self.close()
+                raise
+
+            if response is not None:
+                return response
+
+            self.close()
+            if attempt:
+                raise ConnectionError("Session server closed the connection")
 
     def connect(
         self,
@@ -596,14 +1006,20 @@ class SessionClient:
         text: str,
         session: str = "default",
         wait_time: float = 5.0,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        """Send a command and get response."""
-        return self._send_request({
+        """
+        Send a command and get response.
+
+        fields limits the response to some of RESPONSE_FIELDS
+        (default: all of them).
+        """
+        return self._send_request(_with_fields({
             "command": "send",
             "session": session,
             "text": text,
             "wait_time": wait_time,
-        })
+        }, fields))
 
     def send_raw(self, text: str, session: str = "default") -> Dict[str, Any]:
         """Send raw text without waiting."""
@@ -613,29 +1029,39 @@ class SessionClient:
             "text": text,
         })
 
-    def read(self, session: str = "default") -> Dict[str, Any]:
-        """Read available data."""
-        return self._send_request({
+    def read(
+        self,
+        session: str = "default",
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Read available data (fields default: raw, clean)."""
+        return self._send_request(_with_fields({
             "command": "read",
             "session": session,
-        })
+        }, fields))
 
-    def peek(self, session: str = "default", max_wait: float = 0.1) -> Dict[str, Any]:
+    def peek(
+        self,
+        session: str = "default",
+        max_wait: float = 0.1,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
         """
         Peek for available data without blocking long.
 
         Args:
             session: Session name
             max_wait: Max time to wait for data (default 100ms)
+            fields: Response fields to return (default: raw, clean)
 
         Returns:
             Response with 'has_data' bool indicating if data was found
         """
-        return self._send_request({
+        return self._send_request(_with_fields({
             "command": "peek",
             "session": session,
             "max_wait": max_wait,
-        })
+        }, fields))
 
     def batch(
         self,
@@ -643,6 +1069,8 @@ class SessionClient:
         session: str = "default",
         wait_time: float = 2.0,
         fast: bool = False,
+        fields: Optional[List[str]] = None,
+        pipeline: bool = False,
     ) -> Dict[str, Any]:
         """
         Send multiple commands and collect all responses.
@@ -652,17 +1080,23 @@ class SessionClient:
             session: Session name
             wait_time: Time to wait for each response
             fast: Use fast mode (shorter timeout)
+            fields: Fields for each result (default: raw, clean,
+                prompt_detected); "command" is always included
+            pipeline: Send all commands at once and split the output by
+                prompt - one MUD round trip instead of one per command,
+                for MUDs that send a prompt after every command
 
         Returns:
             Response with 'results' list of individual command responses
         """
-        return self._send_request({
+        return self._send_request(_with_fields({
             "command": "batch",
             "session": session,
             "commands": commands,
             "wait_time": wait_time,
             "fast": fast,
-        })
+            "pipeline": pipeline,
+        }, fields))
 
     def status(self, session: str = None) -> Dict[str, Any]:
         """Get session status."""
@@ -714,10 +1148,44 @@ class SessionClient:
         return self._send_request({"command": "shutdown"})
 
     @staticmethod
-    def is_server_running(socket_path: str = DEFAULT_SOCKET_PATH) -> bool:
-        """Check if server is running."""
+    def is_server_running(
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        pid_file: Optional[str] = None,
+    ) -> bool:
+        """
+        Check if server is running.
+
+        A signal-0 check on the PID in the server's PID file rules out a
+        dead server cheaply. A live PID may belong to an unrelated
+        process that reused it, so the socket must also accept a
+        connect() probe, which is all that is checked without a usable
+        PID file.
+
+        Args:
+            socket_path: Path to the server's Unix socket
+            pid_file: The server's PID file (default: DEFAULT_PID_FILE
+                when socket_path is the default socket, else none)
+
+        Returns:
+            True if a server appears to be running
+        """
         if not os.path.exists(socket_path):
             return False
+
+        if pid_file is None and socket_path == DEFAULT_SOCKET_PATH:
+            pid_file = DEFAULT_PID_FILE
+        if pid_file:
+            try:
+                with open(pid_file) as f:
+                    pid = int(f.read().strip())
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return False
+            except PermissionError:
+                pass  # Alive, just owned by another user
+            except (OSError, ValueError):
+                pass  # No usable PID file - probe the socket instead
+
         try:
             sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             sock.connect(socket_path)
@@ -734,15 +1202,32 @@ def start_server_background(
     """
     Start the session server in the background.
 
+    Returns once the server is listening.
+
     Returns:
         PID of the server process
+
+    Raises:
+        RuntimeError: If the server exits before it starts listening
     """
+    # The server writes a byte here once listening; if it dies first, the
+    # write end closes with it and the parent reads EOF instead
+    ready_r, ready_w = os.pipe()
+
     pid = os.fork()
     if pid > 0:
-        # Parent - wait a moment for server to start
-        time.sleep(0.5)
+        # Parent - block until the server is up (or gone)
+        os.close(ready_w)
+        try:
+            ready = os.read(ready_r, 1)
+        finally:
+            os.close(ready_r)
+        if not ready:
+            raise RuntimeError(f"Session server failed to start; see {log_file}")
         return pid
 
+    os.close(ready_r)
+
     # Child - become session leader
     os.setsid()
 
@@ -765,6 +1250,10 @@ def start_server_background(
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    def signal_ready() -> None:
+        os.write(ready_w, b"1")
+        os.close(ready_w)
+
     server = SessionServer(socket_path=socket_path)
-    server.start()
+    server.start(on_ready=signal_ready)
     os._exit(0)
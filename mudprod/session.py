@@ -6,18 +6,31 @@ automatically reconnecting when connections drop.
 """
 
 import logging
+import sys
 import threading
-from typing import Dict, Optional, List
-from dataclasses import dataclass, field
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, List
+from dataclasses import dataclass, field, replace
 
 from .client import MUDClient, LoginConfig, PromptConfig, ConnectionState
 
+# ConnectionState -> its name, looked up instead of going through the
+# enum's .name descriptor for every session on every status() poll
+_STATE_NAMES: Dict[ConnectionState, str] = {state: state.name for state in ConnectionState}
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SessionConfig:
     """
     Configuration for creating a session.
 
+    Frozen (and slotted on Python 3.10+), so instances are small and can
+    be shared; use from_template() to derive variants.
+
     Attributes:
         host: Server hostname or IP
         port: Server port
@@ -33,6 +46,25 @@ class SessionConfig:
     auto_reconnect: bool = True
     timeout: float = 10.0
 
+    @classmethod
+    def from_template(cls, template: "SessionConfig", **overrides) -> "SessionConfig":
+        """
+        A copy of template with some fields replaced.
+
+        login_config and prompt_config are shared by reference, not
+        copied, so many sessions built from one template hold a single
+        LoginConfig/PromptConfig (and its compiled patterns).
+
+        Args:
+            template: Config to start from
+            **overrides: Fields to change (e.g. login_config for another
+                character, or port)
+
+        Returns:
+            A new SessionConfig
+        """
+        return replace(template, **overrides)
+
 
 class SessionManager:
     """
@@ -68,17 +100,60 @@ class SessionManager:
     Thread-safe for concurrent test execution.
     """
 
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    # Most threads used to disconnect or reconnect sessions at once
+    MAX_PARALLEL = 32
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        max_sessions: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        client_pool_size: int = 0,
+    ):
         """
         Initialize the session manager.
 
         Args:
             logger: Optional logger instance
+            max_sessions: Cap on open sessions; creating one beyond it
+                closes the least recently used (default: no cap)
+            idle_timeout: Close sessions not used (no get/get_or_create
+                and no send or read on the client) for this many seconds
+                (default: never)
+            client_pool_size: Keep up to this many closed MUDClient
+                objects for reuse by later sessions (default: none).
+                Only enable this if callers drop their references to a
+                client once its session is closed.
         """
         self.logger = logger or logging.getLogger(__name__)
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.client_pool_size = client_pool_size
         self._sessions: Dict[str, MUDClient] = {}
         self._configs: Dict[str, SessionConfig] = {}
-        self._lock = threading.RLock()
+        # One lock per session serializes its slow work (connect, login,
+        # reconnect, disconnect) without blocking other sessions.
+        # Reentrant, so a holder (see session_lock()) may call close().
+        self._session_locks: Dict[str, threading.RLock] = {}
+        # Names reserved by a create() still connecting -> set once it is
+        # published (or abandoned), so other callers can wait on it
+        self._pending: Dict[str, threading.Event] = {}
+        # Closes idle sessions; runs only while there are sessions
+        self._reaper: Optional[threading.Thread] = None
+        # Closed clients kept for reuse (list append/pop are atomic)
+        self._client_pool: List[MUDClient] = []
+        # Running totals for connected_count()/in_game_count(), kept up
+        # to date by each session client's on_state_change callback.
+        # _counted holds the state last counted for each tracked client.
+        self._count_lock = threading.Lock()
+        self._counted: Dict[int, ConnectionState] = {}
+        self._connected_count = 0
+        self._in_game_count = 0
+        # Registry lock: guards adding and removing sessions and is never
+        # held across a connect. Single lookups skip it entirely - one
+        # dict operation is atomic under the GIL. Not reentrant: nothing
+        # that runs with it held may call back into a locking method.
+        self._lock = threading.Lock()
 
     def create(
         self,
@@ -89,6 +164,11 @@ class SessionManager:
         """
         Create a new named session.
 
+        The name is reserved up front, but the session only becomes
+        visible once connected and logged in; get() calls for it wait
+        until then. If the session is closed while still connecting, the
+        client is disconnected as soon as the connect finishes.
+
         Args:
             name: Unique identifier for this session
             config: Session configuration
@@ -101,10 +181,177 @@ class SessionManager:
             ValueError: If session name already exists
         """
         with self._lock:
-            if name in self._sessions:
+            if name in self._sessions or name in self._pending:
                 raise ValueError(f"Session '{name}' already exists. Use get() or close() first.")
+            evicted = self._evict_for_new()
+            ready = self._pending[name] = threading.Event()
+
+        self._run_parallel(self._disconnect, evicted)
+        return self._build(name, config, ready, connect)
+
+    def create_many(
+        self,
+        configs: Dict[str, SessionConfig],
+        connect: bool = True,
+    ) -> Dict[str, MUDClient]:
+        """
+        Create several named sessions, connecting them in parallel.
+
+        All names are checked and reserved in one go, so either every
+        session is created or (on a duplicate name) none is. With
+        max_sessions set, existing sessions are evicted to make room,
+        but a batch larger than max_sessions is still created in full.
+
+        Args:
+            configs: Mapping of session name to its configuration
+            connect: Whether to connect immediately (default: True)
+
+        Returns:
+            Mapping of session name to its MUDClient
+
+        Raises:
+            ValueError: If any session name already exists
+        """
+        with self._lock:
+            for name in configs:
+                if name in self._sessions or name in self._pending:
+                    raise ValueError(f"Session '{name}' already exists. Use get() or close() first.")
+            evicted = []
+            readies = {}
+            for name in configs:
+                evicted.extend(self._evict_for_new())
+                readies[name] = self._pending[name] = threading.Event()
+
+        self._run_parallel(self._disconnect, evicted)
+
+        def build(name: str) -> MUDClient:
+            return self._build(name, configs[name], readies[name], connect)
+
+        names = list(configs)
+        return dict(zip(names, self._run_parallel(build, names)))
+
+    def _evict_for_new(self) -> list:
+        """
+        Make room for one more session under max_sessions. Call with _lock held.
+
+        Returns:
+            The removed (name, client, session lock) entries, to be
+            disconnected once the lock is released
+        """
+        if self.max_sessions is None:
+            return []
+        evicted = []
+        while self._sessions and len(self._sessions) + len(self._pending) >= self.max_sessions:
+            name = min(self._sessions, key=lambda n: self._sessions[n].last_activity)
+            self.logger.info("Evicting least recently used session '%s'", name)
+            evicted.append(self._remove(name))
+        return evicted
+
+    def _remove(self, name: str) -> tuple:
+        """Unregister a published session. Call with _lock held."""
+        # _sessions first: lock-free readers go through it, so they stop
+        # finding the session before its other entries disappear
+        client = self._sessions.pop(name)
+        self._configs.pop(name, None)
+        self._untrack(client)
+        return name, client, self._session_locks.pop(name)
+
+    def _track(self, client: MUDClient) -> None:
+        """Start counting a published session's state changes."""
+        with self._count_lock:
+            self._counted[id(client)] = client.state
+            self._count(client.state, 1)
+            client.on_state_change = self._on_state_change
+
+    def _untrack(self, client: MUDClient) -> None:
+        """Stop counting a removed session."""
+        with self._count_lock:
+            client.on_state_change = None
+            state = self._counted.pop(id(client), None)
+            if state is not None:
+                self._count(state, -1)
+
+    def _untrack_all(self, clients: Iterable[MUDClient]) -> None:
+        """Stop counting every session (close_all)."""
+        with self._count_lock:
+            for client in clients:
+                client.on_state_change = None
+            self._counted.clear()
+            self._connected_count = 0
+            self._in_game_count = 0
+
+    def _on_state_change(self, client: MUDClient, state: ConnectionState) -> None:
+        """MUDClient.on_state_change callback: move the client between counts."""
+        with self._count_lock:
+            old = self._counted.get(id(client))
+            if old is None:
+                return  # Removed while the change was being reported
+            self._count(old, -1)
+            self._count(state, 1)
+            self._counted[id(client)] = state
+
+    def _count(self, state: ConnectionState, delta: int) -> None:
+        """Add delta to the totals state belongs to. Call with _count_lock held."""
+        if state is not ConnectionState.DISCONNECTED:
+            self._connected_count += delta
+        if state is ConnectionState.IN_GAME:
+            self._in_game_count += delta
+
+    def _build(
+        self,
+        name: str,
+        config: SessionConfig,
+        ready: threading.Event,
+        connect: bool = True,
+    ) -> MUDClient:
+        """
+        Construct, connect and publish a session reserved in _pending.
+
+        Runs without the registry lock, so slow connects and logins of
+        different sessions proceed in parallel.
+        """
+        client = None
+        try:
+            client = self._acquire_client(config)
+            if connect:
+                if not client.connect():
+                    self.logger.error("Failed to connect session '%s'", name)
+                elif config.login_config:
+                    if not client.login(config.login_config):
+                        self.logger.error("Failed to login session '%s'", name)
+        finally:
+            with self._lock:
+                # Our reservation is gone if close() ran in the meantime
+                published = self._pending.get(name) is ready
+                if published:
+                    if client is not None:
+                        # Lock first: lock-free readers that find the
+                        # client expect its lock to exist
+                        self._session_locks[name] = threading.RLock()
+                        self._configs[name] = config
+                        client.last_activity = time.monotonic()
+                        self._sessions[name] = client
+                        self._track(client)
+                        self._start_reaper()
+                    # Only now drop the reservation: a lock-free reader
+                    # always finds the name in _pending or _sessions
+                    del self._pending[name]
+            ready.set()
+
+        if not published:
+            client.disconnect()
+            self.logger.info("Session '%s' was closed while connecting", name)
+            return client
+
+        self.logger.info("Created session '%s'", name)
+        return client
 
-            client = MUDClient(
+    def _acquire_client(self, config: SessionConfig) -> MUDClient:
+        """A client for config: a pooled one if available, else a new one."""
+        try:
+            client = self._client_pool.pop()
+        except IndexError:
+            return MUDClient(
                 host=config.host,
                 port=config.port,
                 timeout=config.timeout,
@@ -113,31 +360,65 @@ class SessionManager:
                 auto_reconnect=config.auto_reconnect,
             )
 
-            self._sessions[name] = client
-            self._configs[name] = config
-
-            if connect:
-                if not client.connect():
-                    self.logger.error(f"Failed to connect session '{name}'")
-                elif config.login_config:
-                    if not client.login(config.login_config):
-                        self.logger.error(f"Failed to login session '{name}'")
+        client.host = config.host
+        client.port = config.port
+        client.timeout = config.timeout
+        client.prompt_config = config.prompt_config or PromptConfig()
+        client.auto_reconnect = config.auto_reconnect
+        return client
 
-            self.logger.info(f"Created session '{name}'")
-            return client
+    def _release(self, client: MUDClient) -> None:
+        """Disconnect a removed session's client and pool it if there's room."""
+        client.disconnect()
+        if len(self._client_pool) < self.client_pool_size:
+            client._reset()
+            self._client_pool.append(client)
 
     def get(self, name: str) -> Optional[MUDClient]:
         """
         Get an existing session by name.
 
+        If the session is still being created, waits for it to finish
+        connecting.
+
         Args:
             name: Session identifier
 
         Returns:
             The MUDClient instance, or None if not found
         """
-        with self._lock:
-            return self._sessions.get(name)
+        client = self._sessions.get(name)
+        if client is None:
+            ready = self._pending.get(name)
+            if ready is not None:
+                # Bounded by the connect and login timeouts of the creator
+                ready.wait()
+            # Look again either way: the creator may have published it
+            # between the two lookups above
+            client = self._sessions.get(name)
+        if client is not None:
+            client.last_activity = time.monotonic()
+        return client
+
+    def session_lock(self, name: str) -> Optional[threading.RLock]:
+        """
+        Get the lock serializing work on a session.
+
+        Hold it across calls on the session's client so that other
+        threads' commands don't interleave with them. It is reentrant,
+        so the holder may still close() the session.
+
+        Args:
+            name: Session identifier
+
+        Returns:
+            The session's lock, or None if not found
+        """
+        session_lock = self._session_locks.get(name)
+        if session_lock is None and self.get(name) is not None:
+            # Was still being created; get() waited for it
+            session_lock = self._session_locks.get(name)
+        return session_lock
 
     def get_or_create(
         self,
@@ -148,6 +429,8 @@ class SessionManager:
         Get an existing session or create a new one.
 
         If the session exists but is disconnected, attempts to reconnect.
+        If another thread is creating it, waits for that instead of
+        building a second client.
 
         Args:
             name: Session identifier
@@ -156,15 +439,38 @@ class SessionManager:
         Returns:
             The MUDClient instance
         """
-        with self._lock:
-            if name in self._sessions:
-                client = self._sessions[name]
-                if not client.is_connected:
-                    self.logger.info(f"Session '{name}' disconnected, reconnecting...")
-                    client.reconnect()
-                return client
+        # Fast path, no locks: the session exists and is still connected
+        client = self._sessions.get(name)
+        if client is not None and client.is_connected:
+            client.last_activity = time.monotonic()
+            return client
 
-            return self.create(name, config)
+        while True:
+            with self._lock:
+                client = self._sessions.get(name)
+                if client is not None:
+                    session_lock = self._session_locks[name]
+                    client.last_activity = time.monotonic()
+                    break
+                ready = self._pending.get(name)
+                if ready is None:
+                    evicted = self._evict_for_new()
+                    ready = self._pending[name] = threading.Event()
+                    creating = True
+                else:
+                    creating = False
+
+            if creating:
+                self._run_parallel(self._disconnect, evicted)
+                return self._build(name, config, ready)
+            ready.wait()
+
+        # Only this session waits on the reconnect
+        with session_lock:
+            if not client.is_connected:
+                self.logger.info("Session '%s' disconnected, reconnecting...", name)
+                client.reconnect()
+        return client
 
     def close(self, name: str) -> bool:
         """
@@ -177,14 +483,20 @@ class SessionManager:
             True if session was closed, False if not found
         """
         with self._lock:
+            if name in self._pending:
+                # Still connecting - _build() disconnects it when done
+                del self._pending[name]
+                self.logger.info("Closed session '%s'", name)
+                return True
+
             if name not in self._sessions:
                 return False
+            item = self._remove(name)
 
-            client = self._sessions.pop(name)
-            self._configs.pop(name, None)
-            client.disconnect()
-            self.logger.info(f"Closed session '{name}'")
-            return True
+        # Disconnect after releasing the registry lock, so a slow socket
+        # close doesn't block every other manager call
+        self._disconnect(item)
+        return True
 
     def close_all(self) -> int:
         """
@@ -194,11 +506,102 @@ class SessionManager:
             Number of sessions closed
         """
         with self._lock:
-            count = len(self._sessions)
-            for name in list(self._sessions.keys()):
-                self.close(name)
-            self.logger.info(f"Closed {count} sessions")
-            return count
+            count = len(self._sessions) + len(self._pending)
+            # Sessions still connecting are disconnected by their creators
+            self._pending.clear()
+            # One snapshot, then each dict emptied in one step rather
+            # than popped a name at a time
+            closing = tuple(
+                (name, client, self._session_locks[name])
+                for name, client in self._sessions.items()
+            )
+            self._untrack_all(client for _, client, _ in closing)
+            self._sessions.clear()
+            self._configs.clear()
+            self._session_locks.clear()
+
+        # Disconnect outside the registry lock, all at once
+        self._run_parallel(self._disconnect, closing)
+        self.logger.info("Closed %s sessions", count)
+        return count
+
+    def _start_reaper(self) -> None:
+        """Start the idle reaper if idle_timeout is set. Call with _lock held."""
+        if self.idle_timeout is None or self._reaper is not None:
+            return
+        self._reaper = threading.Thread(
+            target=self._reap_idle, name="mudprod-reaper", daemon=True
+        )
+        self._reaper.start()
+
+    def _reap_idle(self) -> None:
+        """Close sessions idle longer than idle_timeout, until none are left."""
+        while True:
+            time.sleep(self.idle_timeout / 2)
+            cutoff = time.monotonic() - self.idle_timeout
+            idle = [
+                (name, client, cutoff)
+                for name, client in list(self._sessions.items())
+                if client.last_activity < cutoff
+            ]
+            self._run_parallel(self._reap, idle)
+
+            with self._lock:
+                done = not self._sessions and not self._pending
+                if done:
+                    self._reaper = None
+            if done:
+                return
+
+    def _reap(self, item: tuple) -> None:
+        """Close one (name, client, cutoff) if it is still idle and not in use."""
+        name, client, cutoff = item
+        session_lock = self._session_locks.get(name)
+        # A held lock means someone is using the session right now
+        if session_lock is None or not session_lock.acquire(blocking=False):
+            return
+        try:
+            with self._lock:
+                if self._sessions.get(name) is not client or client.last_activity >= cutoff:
+                    return  # Closed, replaced or used since the scan
+                self._remove(name)
+            self.logger.info("Session '%s' idle for %ss", name, self.idle_timeout)
+            self._release(client)
+            self.logger.info("Closed session '%s'", name)
+        finally:
+            session_lock.release()
+
+    def _disconnect(self, item: tuple) -> None:
+        """Disconnect one (name, client, session lock) removed from the registry."""
+        name, client, session_lock = item
+        with session_lock:
+            self._release(client)
+        self.logger.info("Closed session '%s'", name)
+
+    def _run_parallel(self, func: Callable[[Any], Any], items: list) -> list:
+        """Call func on every item concurrently; results in item order."""
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL, len(items))) as pool:
+            return list(pool.map(func, items))
+
+    def connected_count(self) -> int:
+        """
+        Number of sessions currently connected, without polling each one.
+
+        Returns:
+            Count of sessions whose state is not DISCONNECTED
+        """
+        return self._connected_count
+
+    def in_game_count(self) -> int:
+        """
+        Number of sessions currently logged in and in-game.
+
+        Returns:
+            Count of sessions in the IN_GAME state
+        """
+        return self._in_game_count
 
     def list_sessions(self) -> List[str]:
         """
@@ -207,8 +610,7 @@ class SessionManager:
         Returns:
             List of session names
         """
-        with self._lock:
-            return list(self._sessions.keys())
+        return list(self._sessions)
 
     def status(self) -> Dict[str, Dict]:
         """
@@ -217,17 +619,17 @@ class SessionManager:
         Returns:
             Dict mapping session names to status info
         """
-        with self._lock:
-            result = {}
-            for name, client in self._sessions.items():
-                result[name] = {
-                    "connected": client.is_connected,
-                    "in_game": client.is_in_game,
-                    "state": client.state.name,
-                    "host": client.host,
-                    "port": client.port,
-                }
-            return result
+        # Snapshot, then read each client without blocking the manager
+        return {
+            name: {
+                "connected": client.is_connected,
+                "in_game": client.is_in_game,
+                "state": _STATE_NAMES[client.state],
+                "host": client.host,
+                "port": client.port,
+            }
+            for name, client in list(self._sessions.items())
+        }
 
     def ensure_all_connected(self) -> Dict[str, bool]:
         """
@@ -236,21 +638,37 @@ class SessionManager:
         Returns:
             Dict mapping session names to connection success status
         """
-        with self._lock:
-            results = {}
-            for name, client in self._sessions.items():
-                results[name] = client.ensure_connected()
-            return results
+        # Reconnects run concurrently and outside the registry lock, so
+        # the total wait is the slowest reconnect, not the sum of them
+        items = list(self._sessions.items())
+        connected = self._run_parallel(self._ensure_connected, items)
+        return {
+            name: ok
+            for (name, _), ok in zip(items, connected)
+            if ok is not None
+        }
+
+    def _ensure_connected(self, item: tuple) -> Optional[bool]:
+        """ensure_connected() one (name, client); None if since closed."""
+        name, client = item
+        session_lock = self._session_locks.get(name)
+        if session_lock is None:
+            return None
+        with session_lock:
+            return client.ensure_connected()
 
     def __len__(self) -> int:
         """Number of sessions."""
-        with self._lock:
-            return len(self._sessions)
+        return len(self._sessions)
 
     def __contains__(self, name: str) -> bool:
-        """Check if session exists."""
-        with self._lock:
-            return name in self._sessions
+        """Check if session exists, waiting for one still being created."""
+        if name in self._sessions:
+            return True
+        ready = self._pending.get(name)
+        if ready is not None:
+            ready.wait()
+        return name in self._sessions
 
     def __enter__(self) -> "SessionManager":
         """Context manager entry."""